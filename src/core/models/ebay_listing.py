@@ -6,7 +6,9 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from src.shared.utils.url_utils import normalize_url
 
 
 class EbayListing(BaseModel):
@@ -23,11 +25,13 @@ class EbayListing(BaseModel):
         scraped_at: Timestamp when listing was scraped
     """
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     title: str = Field(..., min_length=1, max_length=500)
     subtitle: Optional[str] = Field(None, max_length=500)
     price: Decimal = Field(..., gt=0, decimal_places=2)
-    source_url: HttpUrl
-    image_url: Optional[HttpUrl] = None
+    source_url: str
+    image_url: Optional[str] = None
     is_best_match: bool = Field(default=False)
     scraped_at: datetime = Field(default_factory=datetime.now)
     
@@ -50,6 +54,23 @@ class EbayListing(BaseModel):
             raise ValueError("Price cannot exceed 1,000,000")
         return v
     
+    @field_validator("source_url", "image_url")
+    @classmethod
+    def validate_url(cls, v: Optional[str]) -> Optional[str]:
+        """
+        Validates that URLs are absolute http(s) URLs and normalizes them.
+        
+        Args:
+            v: URL value to validate
+            
+        Returns:
+            Validated URL, percent-encoded like pydantic's HttpUrl
+            
+        Raises:
+            ValueError: If the URL is not a valid http(s) URL
+        """
+        return normalize_url(v)
+    
     def get_total_price(self) -> Decimal:
         """
         Get the listing price (no shipping data extracted currently).
@@ -58,9 +79,3 @@ class EbayListing(BaseModel):
             Listing price
         """
         return self.price
-    
-    class Config:
-        json_encoders = {
-            Decimal: str,
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
@@ -6,7 +6,9 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from src.shared.utils.url_utils import normalize_url
 
 
 class IdealoProduct(BaseModel):
@@ -24,11 +26,13 @@ class IdealoProduct(BaseModel):
         scraped_at: Timestamp when product was scraped
     """
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     name: str = Field(..., min_length=1, max_length=500)
     price: Decimal = Field(..., gt=0, decimal_places=2)
     discount: Optional[Decimal] = Field(None, ge=0, le=1, decimal_places=2)
-    source_url: HttpUrl
-    image_url: Optional[HttpUrl] = None
+    source_url: str
+    image_url: Optional[str] = None
     category: str = Field("Electronics", max_length=100)
     is_active: bool = Field(True)
     scraped_at: datetime = Field(default_factory=datetime.now)
@@ -52,6 +56,23 @@ class IdealoProduct(BaseModel):
             raise ValueError("Price cannot exceed 1,000,000")
         return v
     
+    @field_validator("source_url", "image_url")
+    @classmethod
+    def validate_url(cls, v: Optional[str]) -> Optional[str]:
+        """
+        Validates that URLs are absolute http(s) URLs and normalizes them.
+        
+        Args:
+            v: URL value to validate
+            
+        Returns:
+            Validated URL, percent-encoded like pydantic's HttpUrl
+            
+        Raises:
+            ValueError: If the URL is not a valid http(s) URL
+        """
+        return normalize_url(v)
+    
     @field_validator("discount")
     @classmethod
     def validate_discount(cls, v: Optional[Decimal]) -> Optional[Decimal]:
@@ -71,10 +92,3 @@ class IdealoProduct(BaseModel):
             if v < 0 or v > 1:
                 raise ValueError("Discount must be between 0 and 1 (0% to 100%)")
         return v
-    
-    
-    class Config:
-        json_encoders = {
-            Decimal: str,
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
@@ -6,7 +6,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from src.shared.config.app_settings import get_app_config
 from .ebay_listing import EbayListing
@@ -27,6 +27,8 @@ class ProductComparison(BaseModel):
         comparison_date: When the comparison was made
     """
     
+    model_config = ConfigDict(extra="forbid")
+    
     idealo_product: IdealoProduct
     ebay_listings: List[EbayListing] = Field(default_factory=list)
     potential_profit: Optional[Decimal] = None
@@ -35,6 +37,30 @@ class ProductComparison(BaseModel):
     min_ebay_price: Optional[Decimal] = None
     comparison_date: datetime = Field(default_factory=datetime.now)
     
+    # cheapest listing found by calculate_profitability
+    _cheapest_listing: Optional[EbayListing] = PrivateAttr(default=None)
+    
+    @classmethod
+    def from_validated(
+        cls,
+        idealo_product: IdealoProduct,
+        ebay_listings: List[EbayListing]
+    ) -> "ProductComparison":
+        """
+        Build a comparison from already validated models without validating them again.
+        
+        Both models are validated when they are scraped, so the hot compare loop
+        skips a second validation pass over every listing.
+        
+        Args:
+            idealo_product: Validated Idealo product
+            ebay_listings: Validated eBay listings
+            
+        Returns:
+            New comparison with default profitability fields
+        """
+        return cls.model_construct(idealo_product=idealo_product, ebay_listings=list(ebay_listings))
+    
     def calculate_profitability(
         self, 
         min_profit_margin: Decimal = Decimal("50.0")
@@ -51,8 +77,15 @@ class ProductComparison(BaseModel):
             return
         
         # find minimum eBay price - this is what we need to beat
-        ebay_prices = [listing.get_total_price() for listing in self.ebay_listings]
-        self.min_ebay_price = min(ebay_prices)
+        # (single pass, remembering the listing it came from)
+        min_price = None
+        min_listing = None
+        for listing in self.ebay_listings:
+            price = listing.get_total_price()
+            if min_price is None or price < min_price:
+                min_price, min_listing = price, listing
+        self.min_ebay_price = min_price
+        self._cheapest_listing = min_listing
         
         # calculate potential profit based on MINIMUM eBay price
         # we need to be able to sell below the lowest eBay price and still make profit
@@ -78,7 +111,10 @@ class ProductComparison(BaseModel):
         """
         if not self.ebay_listings:
             return None
-        return min(self.ebay_listings, key=lambda x: x.get_total_price())
+        if self._cheapest_listing is not None:
+            # already found by calculate_profitability
+            return self._cheapest_listing
+        return min(self.ebay_listings, key=EbayListing.get_total_price)
     
     def get_summary(self) -> str:
         """
@@ -110,9 +146,3 @@ class ProductComparison(BaseModel):
             f"Profit Margin: {percentage_text}\n"
             f"Profitable: {'Yes' if self.is_profitable else 'No'}"
         )
-    
-    class Config:
-        json_encoders = {
-            Decimal: str,
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
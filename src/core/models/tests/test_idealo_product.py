@@ -89,4 +89,14 @@ class TestIdealoProduct:
                 price=Decimal("99.99"),
                 source_url="not-a-url"
             )
-        assert "URL" in str(exc_info.value)
\ No newline at end of file
+        assert "URL" in str(exc_info.value)
+    
+    def test_url_normalization(self):
+        """Test non-ASCII characters and spaces are percent-encoded like HttpUrl did."""
+        product = IdealoProduct(
+            name="Test Product",
+            price=Decimal("99.99"),
+            source_url="https://www.idealo.de/preisvergleich/kühlschrank a.html"
+        )
+        
+        assert product.source_url == "https://www.idealo.de/preisvergleich/k%C3%BChlschrank%20a.html"
@@ -107,4 +107,46 @@ class TestProductComparison:
         assert comparison.min_ebay_price is None
         assert comparison.potential_profit is None
         assert comparison.profit_margin is None
-        assert comparison.is_profitable is False
\ No newline at end of file
+        assert comparison.is_profitable is False
+    
+    def test_from_validated_calculates_profitability(self, sample_ebay_listings):
+        """Test comparison built from already validated models."""
+        idealo_product = IdealoProduct(
+            name="Test Product",
+            price=Decimal("100.00"),
+            discount=Decimal("0.20"),
+            source_url="https://idealo.de/test-product"
+        )
+        comparison = ProductComparison.from_validated(
+            idealo_product=idealo_product,
+            ebay_listings=sample_ebay_listings
+        )
+        
+        assert comparison.idealo_product is idealo_product
+        assert comparison.min_ebay_price is None  # not calculated yet
+        
+        comparison.calculate_profitability(min_profit_margin=Decimal("20.0"))
+        
+        assert comparison.min_ebay_price == Decimal("130.00")
+        assert comparison.potential_profit == Decimal("30.00")
+        assert comparison.is_profitable is True
+    
+    def test_cheapest_listing_after_calculation(self, sample_ebay_listings):
+        """Test cheapest listing is the one behind min_ebay_price."""
+        idealo_product = IdealoProduct(
+            name="Test Product",
+            price=Decimal("100.00"),
+            source_url="https://idealo.de/test-product"
+        )
+        comparison = ProductComparison.from_validated(
+            idealo_product=idealo_product,
+            ebay_listings=sample_ebay_listings
+        )
+        
+        # works before the calculation too
+        assert comparison.get_cheapest_listing() is sample_ebay_listings[1]
+        
+        comparison.calculate_profitability()
+        
+        assert comparison.get_cheapest_listing() is sample_ebay_listings[1]
+        assert comparison.get_cheapest_listing().get_total_price() == comparison.min_ebay_price
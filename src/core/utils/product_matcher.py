@@ -11,6 +11,8 @@ from src.shared.logging.log_setup import get_logger
 
 logger = get_logger(__name__)
 
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
 
 class ProductMatcher:
     """Handles matching products between platforms."""
@@ -27,9 +29,9 @@ class ProductMatcher:
             Cleaned product name
         """
         # remove common prefixes/suffixes and normalize
-        cleaned = re.sub(r'[^\w\s]', ' ', name.lower())
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        return cleaned
+        cleaned = _NON_WORD_RE.sub(' ', name.lower())
+        # split/join collapses whitespace runs and strips the ends in one C-level pass
+        return ' '.join(cleaned.split())
     
     @staticmethod
     def categorize_listings(
@@ -2,6 +2,7 @@
 Calculate profit margins, fees, and determine if deals are worth pursuing.
 """
 
+import logging
 from decimal import Decimal
 from typing import List
 
@@ -74,14 +75,16 @@ class ProfitabilityCalculator:
             profit_percent >= min_profit_percentage
         )
         
-        logger.debug(
-            "profitability_check",
-            source_price=str(source_price),
-            selling_price=str(selling_price),
-            profit_amount=str(profit_amount),
-            profit_percent=f"{profit_percent:.1f}%",
-            is_profitable=is_profitable
-        )
+        # the str()/f-string arguments would be built even when debug is filtered out
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "profitability_check",
+                source_price=str(source_price),
+                selling_price=str(selling_price),
+                profit_amount=str(profit_amount),
+                profit_percent=f"{profit_percent:.1f}%",
+                is_profitable=is_profitable
+            )
         
         return is_profitable
     
@@ -99,8 +102,8 @@ class ProfitabilityCalculator:
         if not listings:
             return Decimal("0")
         
-        prices = [listing.get_total_price() for listing in listings]
-        return min(prices)
+        # running min, no intermediate price list
+        return min(listing.get_total_price() for listing in listings)
     
     @staticmethod
     def format_profit_for_display(
@@ -0,0 +1,53 @@
+"""
+Unit tests for ProfitabilityCalculator.
+"""
+
+from decimal import Decimal
+
+from src.core.models.ebay_listing import EbayListing
+from src.core.utils.profitability_calculator import ProfitabilityCalculator
+
+
+class TestProfitabilityCalculator:
+    """Test profit calculations on two-place EUR prices."""
+    
+    def test_simple_profit_is_exact(self):
+        """Test profit keeps exact cents."""
+        profit = ProfitabilityCalculator.calculate_simple_profit(
+            Decimal("100.10"), Decimal("130.30")
+        )
+        
+        assert profit == Decimal("30.20")
+    
+    def test_profit_percentage(self):
+        """Test profit percentage relative to the source price."""
+        assert ProfitabilityCalculator.calculate_profit_percentage(
+            Decimal("100.00"), Decimal("130.50")
+        ) == 30.5
+        assert ProfitabilityCalculator.calculate_profit_percentage(
+            Decimal("0"), Decimal("10.00")
+        ) == 0.0
+    
+    def test_is_profitable_thresholds(self):
+        """Test both margin and percentage thresholds are inclusive."""
+        assert ProfitabilityCalculator.is_profitable(
+            Decimal("100.00"), Decimal("120.00")
+        ) is True
+        assert ProfitabilityCalculator.is_profitable(
+            Decimal("100.00"), Decimal("119.99")
+        ) is False
+        assert ProfitabilityCalculator.is_profitable(
+            Decimal("200.00"), Decimal("229.99"),
+            min_profit_margin=Decimal("20.0"),
+            min_profit_percentage=15.0
+        ) is False
+    
+    def test_best_competitive_price(self):
+        """Test the lowest listing price is returned."""
+        listings = [
+            EbayListing(title="A", price=Decimal("150.00"), source_url="https://ebay.com/item1"),
+            EbayListing(title="B", price=Decimal("129.99"), source_url="https://ebay.com/item2"),
+        ]
+        
+        assert ProfitabilityCalculator.find_best_competitive_price(listings) == Decimal("129.99")
+        assert ProfitabilityCalculator.find_best_competitive_price([]) == Decimal("0")
@@ -1,9 +1,28 @@
 """
 PostgreSQL connection pooling and lifecycle management.
+
+Indexes the scraper's statements rely on (all created by the Django migrations
+in webapp/deal_board):
+
+- deal_board_product (source_url) UNIQUE: conflict target of the product upsert.
+- deal_board_product (source_url) WHERE is_active: partial index that the
+  "deactivate missing products" update scans instead of the whole table.
+- deal_board_ebaylisting (product_id) and deal_board_pricelog (product_id):
+  foreign-key indexes, so the per-product listing delete touches only that
+  product's rows.
+
+No covering (INCLUDE) index on source_url: the upsert has to visit the heap
+row anyway to update it and return id/last_ebay_check, so an index-only scan
+never happens and the extra columns would only slow down writes.
 """
 
+import threading
+import weakref
+
 import psycopg2
 from psycopg2.extensions import connection as Connection
+from psycopg2.extensions import cursor as Cursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from typing import Optional
 
 from src.core.exceptions.database_errors import DatabaseConnectionError
@@ -12,9 +31,81 @@ from src.shared.logging.log_setup import get_logger
 
 logger = get_logger(__name__)
 
+# process-wide pool, created lazily on first use and shared by all handlers
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+# one reusable cursor per borrowed connection, closed when the handler releases it
+_session_cursors: "weakref.WeakKeyDictionary[Connection, Cursor]" = weakref.WeakKeyDictionary()
+
+
+def get_pool() -> ThreadedConnectionPool:
+    """
+    Get the shared connection pool, creating it on first use.
+    
+    Returns:
+        Thread-safe PostgreSQL connection pool
+        
+    Raises:
+        psycopg2.OperationalError: If the initial connection fails
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.closed:
+            db_config = get_app_config().database
+            _pool = ThreadedConnectionPool(
+                minconn=1,
+                maxconn=db_config.DB_POOL_SIZE,
+                dbname=db_config.POSTGRES_DB,
+                user=db_config.POSTGRES_USER,
+                password=db_config.POSTGRES_PASSWORD,
+                host=db_config.POSTGRES_HOST,
+                port=db_config.DB_PORT
+            )
+            logger.info("connection_pool_created", max_connections=db_config.DB_POOL_SIZE)
+        return _pool
+
+
+def close_pool() -> None:
+    """Close all pooled connections. Call once at the end of a run."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and not _pool.closed:
+            _pool.closeall()
+            logger.info("connection_pool_closed")
+        _pool = None
+
+
+def get_cursor(conn: Connection) -> Cursor:
+    """
+    Get the shared cursor for a connection, opening it on first use.
+    
+    Args:
+        conn: Active PostgreSQL connection
+        
+    Returns:
+        Cursor reused by every repository call on this connection
+    """
+    cursor = _session_cursors.get(conn)
+    if cursor is None or cursor.closed:
+        cursor = _session_cursors[conn] = conn.cursor()
+    return cursor
+
+
+def release_cursor(conn: Connection) -> None:
+    """
+    Close the shared cursor of a connection, if one was opened.
+    
+    Args:
+        conn: PostgreSQL connection
+    """
+    cursor = _session_cursors.pop(conn, None)
+    if cursor is not None and not cursor.closed:
+        cursor.close()
+
 
 class ConnectionHandler:
-    """Handles PostgreSQL connection lifecycle."""
+    """Handles PostgreSQL connection lifecycle on top of the shared pool."""
     
     def __init__(self):
         """Initialize connection handler with configuration."""
@@ -23,7 +114,7 @@ class ConnectionHandler:
     
     def connect(self) -> Connection:
         """
-        Establish database connection.
+        Borrow a connection from the shared pool.
         
         Returns:
             PostgreSQL connection object
@@ -32,18 +123,11 @@ class ConnectionHandler:
             DatabaseConnectionError: If connection fails
         """
         try:
-            db_config = self.config.database
-            self.conn = psycopg2.connect(
-                dbname=db_config.POSTGRES_DB,
-                user=db_config.POSTGRES_USER,
-                password=db_config.POSTGRES_PASSWORD,
-                host=db_config.POSTGRES_HOST,
-                port=db_config.DB_PORT
-            )
-            logger.info("database_connected")
+            self.conn = get_pool().getconn()
+            logger.debug("database_connected")
             return self.conn
             
-        except psycopg2.OperationalError as e:
+        except (psycopg2.OperationalError, PoolError) as e:
             logger.error("database_connection_failed", error=str(e))
             raise DatabaseConnectionError(
                 host=self.config.database.POSTGRES_HOST,
@@ -53,11 +137,15 @@ class ConnectionHandler:
             )
     
     def disconnect(self) -> None:
-        """Close database connection."""
+        """Return the connection to the pool, discarding it if broken."""
         if self.conn:
-            self.conn.close()
+            release_cursor(self.conn)
+            if _pool is not None and not _pool.closed:
+                _pool.putconn(self.conn, close=bool(self.conn.closed))
+            else:
+                self.conn.close()
             self.conn = None
-            logger.info("database_disconnected")
+            logger.debug("database_disconnected")
     
     def get_connection(self) -> Connection:
         """
@@ -3,11 +3,13 @@ Generic repository pattern with CRUD operations for any entity.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 import psycopg2
+from psycopg2.extensions import AsIs
 
 from src.core.exceptions.database_errors import DatabaseConnectionError, DatabaseOperationError
+from src.database.handlers.connection_handler import get_cursor
 from src.shared.logging.log_setup import get_logger
 
 logger = get_logger(__name__)
@@ -42,7 +44,7 @@ class BaseRepository(ABC):
         if not self.conn:
             raise DatabaseConnectionError("localhost", 5432, "unknown", "No connection available")
         
-        cursor = self.conn.cursor()
+        cursor = get_cursor(self.conn)
         try:
             cursor.execute(query, params)
             
@@ -55,8 +57,6 @@ class BaseRepository(ABC):
         except Exception as e:
             logger.error("query_execution_failed", query=query[:100], error=str(e))
             raise DatabaseOperationError("EXECUTE", None, str(e))
-        finally:
-            cursor.close()
     
     def _execute_with_return(self, query: str, params: tuple = ()) -> Any:
         """
@@ -75,7 +75,7 @@ class BaseRepository(ABC):
         if not self.conn:
             raise DatabaseConnectionError("localhost", 5432, "unknown", "No connection available")
         
-        cursor = self.conn.cursor()
+        cursor = get_cursor(self.conn)
         try:
             cursor.execute(query, params)
             result = cursor.fetchone()
@@ -84,8 +84,56 @@ class BaseRepository(ABC):
         except Exception as e:
             logger.error("query_with_return_failed", query=query[:100], error=str(e))
             raise DatabaseOperationError("EXECUTE_RETURNING", None, str(e))
-        finally:
-            cursor.close()
+    
+    def _values_list(self, rows: List[tuple], template: str) -> AsIs:
+        """
+        Render rows as a VALUES list to be passed as a query parameter.
+        
+        Args:
+            rows: Sequence of parameter tuples, one per row
+            template: Row template (e.g. "(%s, %s, NOW())")
+            
+        Returns:
+            Pre-quoted VALUES list, inserted verbatim into the query
+        """
+        cursor = get_cursor(self.conn)
+        encoding = psycopg2.extensions.encodings[self.conn.encoding]
+        return AsIs(b",".join(cursor.mogrify(template, row) for row in rows).decode(encoding))
+    
+    def _execute_batch(
+        self,
+        statements: Sequence[Tuple[str, Optional[tuple]]],
+        fetch: bool = False
+    ) -> Optional[List[tuple]]:
+        """
+        Execute several statements in a single round-trip.
+        
+        The statements are rendered client-side and sent as one multi-statement
+        simple query (not libpq pipeline mode), so the server runs them back to
+        back in the current transaction without waiting on the client.
+        
+        Args:
+            statements: (query, params) pairs, executed in order
+            fetch: Whether to return the rows produced by the last statement
+            
+        Returns:
+            Rows of the last statement if fetch is True, otherwise None
+            
+        Raises:
+            DatabaseOperationError: If any statement fails
+        """
+        if not self.conn:
+            raise DatabaseConnectionError("localhost", 5432, "unknown", "No connection available")
+        
+        cursor = get_cursor(self.conn)
+        try:
+            batch = b";\n".join(cursor.mogrify(query, params) for query, params in statements)
+            cursor.execute(batch)
+            return cursor.fetchall() if fetch else None
+            
+        except Exception as e:
+            logger.error("batch_execution_failed", statements=len(statements), error=str(e))
+            raise DatabaseOperationError("BATCH", None, str(e))
     
     def commit(self) -> None:
         """Commit current transaction."""
@@ -2,7 +2,7 @@
 eBay listing storage, updates, and comparison queries.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from src.shared.logging.log_setup import get_logger
 
@@ -14,42 +14,65 @@ logger = get_logger(__name__)
 class EbayListingRepository(BaseRepository):
     """Repository for eBay listing data operations."""
     
-    def delete_old_listings(self, product_id: int) -> None:
+    @staticmethod
+    def _delete_stale_statement(product_id: int, keep_urls: List[str]) -> Tuple[str, tuple]:
         """
-        Remove old eBay listings for a product.
+        Build the statement removing a product's listings that are not in the new scrape.
         
         Args:
-            product_id: Product ID to clear listings for
+            product_id: Product ID to prune listings for
+            keep_urls: Listing URLs that are still present
+            
+        Returns:
+            (query, params) pair
+        """
+        query = """
+            DELETE FROM deal_board_ebaylisting
+            WHERE product_id = %s AND source_url <> ALL(%s)
         """
-        query = "DELETE FROM deal_board_ebaylisting WHERE product_id = %s;"
-        self._execute_query(query, (product_id,))
-        logger.info("old_ebay_listings_deleted", product_id=product_id)
+        return query, (product_id, keep_urls)
     
-    def insert_listing(self, product_id: int, listing_data: Dict[str, Any]) -> None:
+    def _upsert_listings_statement(
+        self, product_id: int, ebay_listings: List[Dict[str, Any]]
+    ) -> Tuple[str, tuple]:
         """
-        Insert new eBay listing for a product.
+        Build the statement inserting or updating a product's listings.
+        
+        Listings are matched on (product_id, source_url); every re-seen listing is
+        refreshed, so scraped_at always records the latest scrape that found it.
         
         Args:
-            product_id: Product ID to associate listing with
-            listing_data: Dictionary with eBay listing data
+            product_id: Product ID to associate listings with
+            ebay_listings: Non-empty list of eBay listing dictionaries, unique by source_url
+            
+        Returns:
+            (query, params) pair
         """
         query = """
             INSERT INTO deal_board_ebaylisting
             (product_id, title, subtitle, price, source_url, image_url, is_best_match, scraped_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, NOW());
+            VALUES %s
+            ON CONFLICT (product_id, source_url) DO UPDATE SET
+                title = EXCLUDED.title,
+                subtitle = EXCLUDED.subtitle,
+                price = EXCLUDED.price,
+                image_url = EXCLUDED.image_url,
+                is_best_match = EXCLUDED.is_best_match,
+                scraped_at = NOW()
         """
-        params = (
-            product_id,
-            listing_data["title"],
-            listing_data.get("subtitle"),
-            listing_data["price"],
-            listing_data["source_url"],
-            listing_data.get("image_url"),
-            listing_data.get("is_best_match", False),  # default to False if not provided
-        )
-        
-        self._execute_query(query, params)
-        logger.debug("ebay_listing_inserted", title=listing_data["title"][:40])
+        rows = [
+            (
+                product_id,
+                listing["title"],
+                listing.get("subtitle"),
+                listing["price"],
+                listing["source_url"],
+                listing.get("image_url"),
+                listing.get("is_best_match", False),
+            )
+            for listing in ebay_listings
+        ]
+        return query, (self._values_list(rows, "(%s, %s, %s, %s, %s, %s, %s, NOW())"),)
     
     def save(self, listing) -> None:
         """
@@ -82,27 +105,30 @@ class EbayListingRepository(BaseRepository):
     
     def update_listings_for_product(self, product_id: int, ebay_listings: List[Dict[str, Any]]) -> None:
         """
-        Replace all eBay listings for a product and update last_ebay_check timestamp.
+        Merge the scraped eBay listings for a product and update last_ebay_check timestamp.
+        
+        Only listings that disappeared are deleted; the others are updated in
+        place instead of being deleted and re-inserted.
         
         Args:
             product_id: Product ID to update
             ebay_listings: List of eBay listing dictionaries
         """
         try:
-            # remove old listings first (original logic)
-            self.delete_old_listings(product_id)
-            
-            # insert new listings
-            for listing in ebay_listings:
-                self.insert_listing(product_id, listing)
+            # the listing url is its identity; one statement can't upsert the same row twice
+            listings_by_url = {listing["source_url"]: listing for listing in ebay_listings}
             
-            # update last_ebay_check timestamp
-            update_timestamp_query = """
-                UPDATE deal_board_product
-                SET last_ebay_check = NOW()
-                WHERE id = %s;
-            """
-            self._execute_query(update_timestamp_query, (product_id,))
+            # drop vanished listings, upsert the rest and touch the product in one round-trip
+            statements = [self._delete_stale_statement(product_id, list(listings_by_url))]
+            if listings_by_url:
+                statements.append(
+                    self._upsert_listings_statement(product_id, list(listings_by_url.values()))
+                )
+            statements.append((
+                "UPDATE deal_board_product SET last_ebay_check = NOW() WHERE id = %s",
+                (product_id,)
+            ))
+            self._execute_batch(statements)
             
             logger.info(
                 "ebay_listings_updated",
@@ -2,10 +2,8 @@
 Idealo product-specific queries, upserts, and price history.
 """
 
-from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
-from zoneinfo import ZoneInfo
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.shared.logging.log_setup import get_logger
 
@@ -17,122 +15,123 @@ logger = get_logger(__name__)
 class IdealoProductRepository(BaseRepository):
     """Repository for Idealo product data operations."""
     
-    def deactivate_all_products(self) -> None:
-        """Mark all products as inactive before processing new data."""
-        query = "UPDATE deal_board_product SET is_active = FALSE;"
-        self._execute_query(query)
-        logger.info("all_products_deactivated")
-    
-    def find_by_source_url(self, source_url: str) -> Optional[tuple]:
+    @staticmethod
+    def _deactivate_missing_statement(active_source_urls: List[str]) -> Tuple[str, tuple]:
         """
-        Find product by source URL.
+        Build the statement that deactivates products missing from the current scrape.
         
         Args:
-            source_url: Product URL from Idealo
+            active_source_urls: Source URLs of products found in the current scrape
             
         Returns:
-            Tuple of (id, latest_price, last_ebay_check) or None if not found
+            (query, params) pair
         """
-        query = "SELECT id, price, last_ebay_check FROM deal_board_product WHERE source_url = %s;"
-        results = self._execute_query(query, (source_url,))
-        return results[0] if results else None
+        query = """
+            UPDATE deal_board_product
+            SET is_active = FALSE
+            WHERE is_active = TRUE AND source_url <> ALL(%s)
+        """
+        return query, (list(active_source_urls),)
     
-    def update_product(self, product_id: int, price: Any, discount: Optional[Any] = None) -> None:
+    @staticmethod
+    def _to_discount_percentage(discount: Optional[Any]) -> int:
         """
-        Update existing product with new price and discount.
+        Convert discount to integer percentage for storage.
         
         Args:
-            product_id: Product ID to update
-            price: New price value
-            discount: New discount value (decimal or percentage)
+            discount: Discount as decimal (0.68) or percentage (68)
+            
+        Returns:
+            Discount as integer percentage (68), 0 if missing
         """
-        # convert decimal discount to integer percentage for storage
         if discount and isinstance(discount, (float, Decimal)):
             # convert from decimal (0.68) to percentage (68)
-            discount_int = int(discount * 100)
-        elif discount:
-            discount_int = int(discount)
-        else:
-            discount_int = 0
-            
-        query = """
-            UPDATE deal_board_product
-            SET price = %s, discount = %s, is_active = TRUE, updated_at = NOW()
-            WHERE id = %s;
-        """
-        self._execute_query(query, (price, discount_int, product_id))
-        logger.debug("product_updated", product_id=product_id)
+            return int(discount * 100)
+        if discount:
+            return int(discount)
+        return 0
     
-    def insert_product(self, product_data: Dict[str, Any]) -> Optional[int]:
+    def _upsert_products_statement(
+        self,
+        products: List[Dict[str, Any]],
+        log_prices: bool = False,
+        stale_after_days: int = 14
+    ) -> Tuple[str, tuple]:
         """
-        Insert new product into database (matching Django model fields).
+        Build the statement that upserts products, optionally logging their prices.
         
         Args:
-            product_data: Dictionary with product information
+            products: List of product dictionaries with unique source URLs
+            log_prices: Whether to also add a price history entry per product
+            stale_after_days: Days after which eBay data is considered stale
             
         Returns:
-            New product ID or None if insertion failed
+            (query, params) pair returning
+            (id, source_url, last_ebay_check, inserted, is_stale) rows
         """
-        # match exact Django model fields with updated field names
-        # include new profit fields with default values (NULL for calculations, FALSE for is_profitable)
-        # convert decimal discount to integer percentage for storage
-        discount_value = product_data.get("discount", 0.0)
-        if discount_value and isinstance(discount_value, (float, Decimal)):
-            # convert from decimal (0.68) to percentage (68)
-            discount_int = int(discount_value * 100)
-        else:
-            discount_int = 0
-            
-        query = """
+        upsert = """
             INSERT INTO deal_board_product 
             (name, source_url, image_url, price, discount, is_active, category, 
              potential_profit, profit_percentage, is_profitable, min_ebay_price,
              created_at, updated_at)
-            VALUES (%s, %s, %s, %s, %s, TRUE, %s, NULL, NULL, FALSE, NULL, NOW(), NOW()) RETURNING id;
+            VALUES %s
+            ON CONFLICT (source_url) DO UPDATE SET
+                price = EXCLUDED.price,
+                discount = EXCLUDED.discount,
+                is_active = TRUE,
+                updated_at = NOW()
+            RETURNING id, source_url, price, last_ebay_check, (xmax = 0) AS inserted
         """
-        params = (
-            product_data["name"],
-            product_data["source_url"],
-            product_data["image_url"],
-            product_data["price"],
-            discount_int,  # now properly converted to integer percentage
-            product_data.get("category", "Unknown")  # use default if not provided
+        # staleness is decided by the database clock; "more than N whole days" since the check
+        stale = "last_ebay_check <= NOW() - make_interval(days => %s + 1) AS is_stale"
+        if log_prices:
+            # price history is written server-side from the upserted rows
+            query = f"""
+                WITH upserted AS ({upsert}),
+                logged AS (
+                    INSERT INTO deal_board_pricelog (product_id, price, scraped_at)
+                    SELECT id, price, NOW() FROM upserted
+                )
+                SELECT id, source_url, last_ebay_check, inserted, {stale} FROM upserted
+            """
+        else:
+            query = f"""
+                WITH upserted AS ({upsert})
+                SELECT id, source_url, last_ebay_check, inserted, {stale} FROM upserted
+            """
+        rows = [
+            (
+                product["name"],
+                product["source_url"],
+                product["image_url"],
+                product["price"],
+                self._to_discount_percentage(product.get("discount")),
+                product.get("category", "Unknown"),
+            )
+            for product in products
+        ]
+        values = self._values_list(
+            rows, "(%s, %s, %s, %s, %s, TRUE, %s, NULL, NULL, FALSE, NULL, NOW(), NOW())"
         )
-        
-        product_id = self._execute_with_return(query, params)
-        if product_id:
-            logger.debug("product_inserted", product_id=product_id, name=product_data["name"][:30])
-        return product_id
+        return query, (values, stale_after_days)
     
-    def add_price_log(self, product_id: int, price: Any) -> None:
+    def update_last_ebay_check_bulk(self, product_ids: List[int]) -> None:
         """
-        Add price history entry for product.
+        Update the last_ebay_check timestamp for several products in one statement.
         
         Args:
-            product_id: Product ID
-            price: Price value to log
+            product_ids: Product IDs to update
         """
-        query = """
-            INSERT INTO deal_board_pricelog (product_id, price, scraped_at)
-            VALUES (%s, %s, NOW());
-        """
-        self._execute_query(query, (product_id, price))
-        logger.debug("price_log_added", product_id=product_id)
-    
-    def update_last_ebay_check(self, product_id: int) -> None:
-        """
-        Update the last_ebay_check timestamp for a product.
+        if not product_ids:
+            return
         
-        Args:
-            product_id: Product ID to update
-        """
         query = """
             UPDATE deal_board_product
             SET last_ebay_check = NOW()
-            WHERE id = %s;
+            WHERE id = ANY(%s)
         """
-        self._execute_query(query, (product_id,))
-        logger.debug("last_ebay_check_updated", product_id=product_id)
+        self._execute_query(query, (list(product_ids),))
+        logger.debug("last_ebay_check_updated", count=len(product_ids))
     
     def update_product_profit(
         self, 
@@ -162,7 +161,7 @@ class IdealoProductRepository(BaseRepository):
             WHERE id = %s;
         """
         self._execute_query(
-            query, 
+            query,
             (potential_profit, profit_percentage, is_profitable, min_ebay_price, product_id)
         )
         logger.info(
@@ -190,64 +189,62 @@ class IdealoProductRepository(BaseRepository):
         needs_ebay_check = []
         
         try:
-            # deactivate all products first (original logic)
-            self.deactivate_all_products()
+            # dedupe by source_url so each product is written once (last one wins)
+            products_by_url = {product["source_url"]: product for product in products_to_process}
+            
+            results = self._execute_batch(
+                [
+                    # scraped data is reproducible, so skip the fsync wait on commit and
+                    # bound how long the bulk statements may block or run (transaction-scoped)
+                    ("SET LOCAL synchronous_commit = off", None),
+                    ("SET LOCAL lock_timeout = '5s'", None),
+                    ("SET LOCAL statement_timeout = '60s'", None),
+                    # deactivate only products that disappeared from the listing;
+                    # scraped products are (re)activated by the upsert below
+                    self._deactivate_missing_statement(list(products_by_url)),
+                    # insert or update all products and log their prices
+                    self._upsert_products_statement(
+                        list(products_by_url.values()),
+                        log_prices=True,
+                        stale_after_days=ebay_check_threshold_days
+                    ),
+                ],
+                fetch=True
+            )
+            upserted = {
+                source_url: (product_id, last_ebay_check, inserted, is_stale)
+                for product_id, source_url, last_ebay_check, inserted, is_stale in results
+            }
             
-            # process each product
-            for product in products_to_process:
-                existing_product = self.find_by_source_url(product["source_url"])
+            for product in products_by_url.values():
+                if product["source_url"] not in upserted:
+                    continue
+                product_id, last_ebay_check, inserted, is_stale = upserted[product["source_url"]]
                 
-                product_id = None
-                if existing_product:
-                    # update existing product
-                    product_id, old_price, last_ebay_check = existing_product
-                    # pass discount with get() to handle missing values
-                    self.update_product(product_id, product["price"], product.get("discount"))
-                    
-                    # check if eBay data is stale
-                    if last_ebay_check is None:
-                        needs_ebay_check.append({
-                            "product_id": product_id,
-                            "name": product["name"],
-                            "type": "returning_never_checked"
-                        })
-                        logger.debug("ebay_check_needed", product_id=product_id, reason="never_checked")
-                    else:
-                        # use timezone-aware datetime for comparison
-                        berlin_tz = ZoneInfo("Europe/Berlin")
-                        now_berlin = datetime.now(berlin_tz)
-                        
-                        # convert last_ebay_check to timezone-aware if needed
-                        if last_ebay_check.tzinfo is None:
-                            # assume database times are in Berlin timezone
-                            last_ebay_check_aware = last_ebay_check.replace(tzinfo=berlin_tz)
-                        else:
-                            # already timezone-aware, convert to Berlin if different
-                            last_ebay_check_aware = last_ebay_check.astimezone(berlin_tz)
-                        
-                        days_since_check = (now_berlin - last_ebay_check_aware).days
-                        if days_since_check > ebay_check_threshold_days:
-                            needs_ebay_check.append({
-                                "product_id": product_id,
-                                "name": product["name"],
-                                "type": "returning_stale"
-                            })
-                            logger.debug("ebay_check_needed", product_id=product_id, days_since=days_since_check)
-                else:
-                    # insert new product
-                    product_id = self.insert_product(product)
+                if inserted:
                     # new products always need eBay check
-                    if product_id:
-                        needs_ebay_check.append({
-                            "product_id": product_id,
-                            "name": product["name"],
-                            "type": "new"
-                        })
-                        logger.debug("ebay_check_needed", product_id=product_id, reason="new_product")
-                
-                # add price history entry (original logic)
-                if product_id:
-                    self.add_price_log(product_id, product["price"])
+                    needs_ebay_check.append({
+                        "product_id": product_id,
+                        "name": product["name"],
+                        "type": "new"
+                    })
+                    logger.debug("ebay_check_needed", product_id=product_id, reason="new_product")
+                elif last_ebay_check is None:
+                    # check if eBay data is stale
+                    needs_ebay_check.append({
+                        "product_id": product_id,
+                        "name": product["name"],
+                        "type": "returning_never_checked"
+                    })
+                    logger.debug("ebay_check_needed", product_id=product_id, reason="never_checked")
+                elif is_stale:
+                    # eBay data older than the threshold (compared in SQL)
+                    needs_ebay_check.append({
+                        "product_id": product_id,
+                        "name": product["name"],
+                        "type": "returning_stale"
+                    })
+                    logger.debug("ebay_check_needed", product_id=product_id, last_ebay_check=last_ebay_check)
             
             # commit all changes
             self.commit()
@@ -4,6 +4,7 @@ Unit tests for IdealoProductRepository.
 
 import pytest
 from decimal import Decimal
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
@@ -134,4 +135,138 @@ class TestIdealoProductRepository:
         assert product_dict['name'] == "Test Product"
         assert product_dict['price'] == Decimal("99.99")
         assert product_dict['discount_percentage'] == 15
-        assert product_dict['source_url'] == "https://idealo.de/test-product"
\ No newline at end of file
+        assert product_dict['source_url'] == "https://idealo.de/test-product"
+
+
+class TestIdealoProductRepositoryStatements:
+    """Test the bulk statements and eBay check classification of IdealoProductRepository."""
+    
+    @pytest.fixture
+    def repository(self):
+        """Provide repository on a mocked connection."""
+        conn = Mock()
+        conn.encoding = "UTF8"
+        return IdealoProductRepository(conn)
+    
+    @pytest.fixture
+    def products(self):
+        """Provide scraped product dictionaries."""
+        return [
+            {
+                "name": "Product 1",
+                "price": Decimal("99.99"),
+                "discount": Decimal("0.15"),
+                "source_url": "https://idealo.de/product1",
+                "image_url": None,
+                "category": "Laptops"
+            },
+            {
+                "name": "Product 2",
+                "price": Decimal("149.99"),
+                "discount": None,
+                "source_url": "https://idealo.de/product2",
+                "image_url": None
+            },
+            {
+                "name": "Product 3",
+                "price": Decimal("19.99"),
+                "discount": 40,
+                "source_url": "https://idealo.de/product3",
+                "image_url": None,
+                "category": "Audio"
+            },
+            {
+                "name": "Product 4",
+                "price": Decimal("5.00"),
+                "discount": None,
+                "source_url": "https://idealo.de/product4",
+                "image_url": None,
+                "category": "Audio"
+            }
+        ]
+    
+    def test_deactivate_missing_statement(self):
+        """Test deactivation only targets active products missing from the scrape."""
+        query, params = IdealoProductRepository._deactivate_missing_statement(
+            ("https://idealo.de/product1", "https://idealo.de/product2")
+        )
+        
+        assert "SET is_active = FALSE" in query
+        assert "is_active = TRUE AND source_url <> ALL(%s)" in query
+        assert params == (["https://idealo.de/product1", "https://idealo.de/product2"],)
+    
+    @patch('src.database.repositories.base_repository.get_cursor')
+    def test_upsert_products_statement(self, mock_get_cursor, repository, products):
+        """Test upsert rows, conflict handling and staleness parameter."""
+        mock_cursor = Mock()
+        mock_cursor.mogrify.side_effect = lambda template, row: repr(row).encode()
+        mock_get_cursor.return_value = mock_cursor
+        
+        query, (values, stale_after_days) = repository._upsert_products_statement(
+            products, stale_after_days=7
+        )
+        
+        assert "ON CONFLICT (source_url) DO UPDATE SET" in query
+        assert "make_interval(days => %s + 1) AS is_stale" in query
+        assert "deal_board_pricelog" not in query
+        assert stale_after_days == 7
+        
+        # discounts are stored as integer percentages, category defaults to Unknown
+        rows = [call.args[1] for call in mock_cursor.mogrify.call_args_list]
+        assert rows[0] == ("Product 1", "https://idealo.de/product1", None, Decimal("99.99"), 15, "Laptops")
+        assert rows[1] == ("Product 2", "https://idealo.de/product2", None, Decimal("149.99"), 0, "Unknown")
+        assert rows[2][4] == 40
+        assert values.getquoted() == b",".join(repr(row).encode() for row in rows)
+    
+    @patch('src.database.repositories.base_repository.get_cursor')
+    def test_upsert_products_statement_logs_prices(self, mock_get_cursor, repository, products):
+        """Test price history is written from the upserted rows when requested."""
+        mock_get_cursor.return_value.mogrify.return_value = b"()"
+        
+        query, params = repository._upsert_products_statement(products, log_prices=True)
+        
+        assert "INSERT INTO deal_board_pricelog (product_id, price, scraped_at)" in query
+        assert "SELECT id, price, NOW() FROM upserted" in query
+        assert params[1] == 14
+    
+    def test_process_scraped_products_classifies_ebay_checks(self, repository, products):
+        """Test returned rows map to new, never checked and stale eBay check types."""
+        checked_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        statements = []
+        
+        def execute_batch(batch, fetch=False):
+            statements.extend(batch)
+            return [
+                (1, "https://idealo.de/product1", None, True, None),
+                (2, "https://idealo.de/product2", None, False, None),
+                (3, "https://idealo.de/product3", checked_at, False, True),
+                (4, "https://idealo.de/product4", checked_at, False, False),
+            ]
+        
+        with patch.object(repository, "_execute_batch", side_effect=execute_batch), \
+                patch.object(repository, "_upsert_products_statement", return_value=("UPSERT", ())) as mock_upsert, \
+                patch.object(repository, "commit") as mock_commit:
+            needs_ebay_check = repository.process_scraped_products(
+                products + [products[0]], ebay_check_threshold_days=7
+            )
+        
+        assert needs_ebay_check == [
+            {"product_id": 1, "name": "Product 1", "type": "new"},
+            {"product_id": 2, "name": "Product 2", "type": "returning_never_checked"},
+            {"product_id": 3, "name": "Product 3", "type": "returning_stale"},
+        ]
+        assert statements[-1] == ("UPSERT", ())
+        mock_upsert.assert_called_once_with(
+            products, log_prices=True, stale_after_days=7
+        )
+        mock_commit.assert_called_once_with()
+    
+    def test_process_scraped_products_rolls_back_on_error(self, repository, products):
+        """Test a failed batch is rolled back and re-raised."""
+        with patch.object(repository, "_execute_batch", side_effect=RuntimeError("boom")), \
+                patch.object(repository, "_upsert_products_statement", return_value=("UPSERT", ())), \
+                patch.object(repository, "rollback") as mock_rollback, \
+                pytest.raises(RuntimeError):
+            repository.process_scraped_products(products)
+        
+        mock_rollback.assert_called_once_with()
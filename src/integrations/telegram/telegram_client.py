@@ -3,7 +3,9 @@ Telegram Bot API client for sending messages and images.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
 
 from src.core.exceptions.base import AutoDropshipperError
 from src.shared.config.telegram_settings import get_telegram_config
@@ -11,6 +13,12 @@ from src.shared.logging.log_setup import get_logger
 
 logger = get_logger(__name__)
 
+# (connect, read) timeouts for Bot API calls
+REQUEST_TIMEOUT = (3.05, 10)
+
+# bot API limit for a single text message
+MAX_MESSAGE_LENGTH = 4096
+
 
 class TelegramNotificationError(AutoDropshipperError):
     """Raised when Telegram notification fails."""
@@ -33,6 +41,29 @@ class TelegramClient:
     def __init__(self):
         """Initialize Telegram client with configuration."""
         self.config = get_telegram_config()
+        
+        # bot API endpoints, built once from the token
+        api_base = f"https://api.telegram.org/bot{self.config.TELEGRAM_BOT_TOKEN}"
+        self._send_message_url = f"{api_base}/sendMessage"
+        self._send_photo_url = f"{api_base}/sendPhoto"
+        
+        # keep-alive session so consecutive messages reuse one TLS connection
+        self._session = requests.Session()
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            # only connect errors and rate limiting are retried; a read error or
+            # 5xx may come after the message was already delivered
+            status_forcelist=(429,),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
     
     def send_notification(self, message: str) -> bool:
         """
@@ -52,16 +83,15 @@ class TelegramClient:
             return False
         
         # validate message is not empty
-        if not message or not message.strip():
+        if not message or message.isspace():
             logger.error("telegram_empty_message", action="skip_notification")
             raise TelegramNotificationError("Cannot send empty message to Telegram")
         
         # telegram has a 4096 character limit for messages
-        if len(message) > 4096:
+        if len(message) > MAX_MESSAGE_LENGTH:
             logger.warning("telegram_message_too_long", original_length=len(message))
             message = message[:4090] + "\n\n..."  # truncate with ellipsis
         
-        url = f"https://api.telegram.org/bot{self.config.TELEGRAM_BOT_TOKEN}/sendMessage"
         payload = {
             'chat_id': self.config.TELEGRAM_CHAT_ID,
             'text': message,
@@ -69,7 +99,7 @@ class TelegramClient:
         }
         
         try:
-            response = requests.post(url, data=payload)
+            response = self._session.post(self._send_message_url, data=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logger.info("telegram_notification_sent")
             return True
@@ -100,7 +130,6 @@ class TelegramClient:
             logger.warning("telegram_not_configured", action="skip_photo")
             return False
         
-        url = f"https://api.telegram.org/bot{self.config.TELEGRAM_BOT_TOKEN}/sendPhoto"
         payload = {
             'chat_id': self.config.TELEGRAM_CHAT_ID,
             'caption': caption,
@@ -110,7 +139,7 @@ class TelegramClient:
         try:
             with open(photo_path, 'rb') as photo_file:
                 files = {'photo': photo_file}
-                response = requests.post(url, data=payload, files=files)
+                response = self._session.post(self._send_photo_url, data=payload, files=files, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 logger.info("telegram_photo_sent", photo_path=photo_path)
                 return True
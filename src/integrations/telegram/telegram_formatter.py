@@ -2,13 +2,14 @@
 Format product comparisons into Telegram-friendly messages.
 """
 
+import html
 from decimal import Decimal
 from typing import Any, Dict, List
 
 from src.core.models.ebay_listing import EbayListing
 from src.core.models.idealo_product import IdealoProduct
-from src.core.utils.profitability_calculator import ProfitabilityCalculator
 from src.shared.logging.log_setup import get_logger
+from src.shared.utils.price_utils import to_cents
 
 logger = get_logger(__name__)
 
@@ -34,7 +35,7 @@ class TelegramFormatter:
                 product_title = 'Unknown Product'
             
             # escape HTML special characters to prevent parsing issues
-            product_title = str(product_title).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            product_title = html.escape(str(product_title), quote=False)
             
             # get idealo URL if provided
             idealo_url = results.get('idealo_product_url')
@@ -44,44 +45,21 @@ class TelegramFormatter:
             else:
                 product_title_with_link = product_title
             
-            message = f"<b>🔎 Scrape Results for:</b> {product_title_with_link}\n\n"
+            # collect the message in parts and join once at the end
+            parts: List[str] = [f"<b>🔎 Scrape Results for:</b> {product_title_with_link}\n\n"]
 
             if results.get('best_matches'):
-                message += "<b>✅ Best Matches:</b>\n"
-                for item in results.get('best_matches', []):
-                    try:
-                        # safely get item fields with defaults
-                        title = str(item.get('Ebay product title', 'Unknown')).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        link = str(item.get('Ebay product link', '#'))
-                        price = float(item.get('Ebay product price', 0))
-                        profit = float(item.get('potential_profit', 0))
-                        
-                        profit_text = f"pot. Profit: <b>€{profit:.2f}</b>"
-                        message += f"- <a href='{link}'>{title}</a>\n"
-                        message += f"  Price: €{price:.2f} | {profit_text}\n\n"
-                    except Exception as e:
-                        logger.warning("format_item_failed", error=str(e), item=item)
-                        continue
+                parts.append("<b>✅ Best Matches:</b>\n")
+                parts.extend(TelegramFormatter._format_item(item) for item in TelegramFormatter._valid_items(results['best_matches']))
             else:
-                message += "❌ No best matches found.\n\n"
+                parts.append("❌ No best matches found.\n\n")
 
             if results.get('less_relevant_matches'):
-                message += "<b>🤔 Less Relevant Matches:</b>\n"
-                for item in results.get('less_relevant_matches', []):
-                    try:
-                        # safely get item fields with defaults
-                        title = str(item.get('Ebay product title', 'Unknown')).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        link = str(item.get('Ebay product link', '#'))
-                        price = float(item.get('Ebay product price', 0))
-                        profit = float(item.get('potential_profit', 0))
-                        
-                        profit_text = f"pot. Profit: <b>€{profit:.2f}</b>"
-                        message += f"- <a href='{link}'>{title}</a>\n"
-                        message += f"  Price: €{price:.2f} | {profit_text}\n\n"
-                    except Exception as e:
-                        logger.warning("format_item_failed", error=str(e), item=item)
-                        continue
+                parts.append("<b>🤔 Less Relevant Matches:</b>\n")
+                parts.extend(TelegramFormatter._format_item(item) for item in TelegramFormatter._valid_items(results['less_relevant_matches']))
 
+            message = "".join(parts)
+            
             # ensure message is never empty
             if not message or len(message.strip()) == 0:
                 message = "eBay search completed but no results could be formatted."
@@ -95,6 +73,53 @@ class TelegramFormatter:
             return f"eBay search completed but formatting failed: {str(e)}"
     
    
+    @staticmethod
+    def _valid_items(items: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Drop match entries that are not dictionaries, logging how many were skipped.
+        
+        Args:
+            items: Match entries from the results dictionary
+            
+        Returns:
+            Entries that can be formatted
+        """
+        valid = [item for item in items if isinstance(item, dict)]
+        if len(valid) != len(items):
+            logger.warning("format_items_skipped", skipped=len(items) - len(valid))
+        return valid
+    
+    @staticmethod
+    def _format_item(item: Dict[str, Any]) -> str:
+        """
+        Format one eBay match as a linked title and a price/profit line.
+        
+        Args:
+            item: Match dictionary as produced by build_comparison_data
+            
+        Returns:
+            Formatted item block, or an empty string if the item is malformed
+        """
+        # build_comparison_data ships the amounts preformatted; only other items need conversion
+        price_text = item.get('Ebay product price_fmt')
+        profit_text = item.get('potential_profit_fmt')
+        if price_text is None or profit_text is None:
+            try:
+                price_text = f"{float(item.get('Ebay product price', 0)):.2f}"
+                profit_text = f"{float(item.get('potential_profit', 0)):.2f}"
+            except (TypeError, ValueError) as e:
+                logger.warning("format_item_failed", error=str(e), item=item)
+                return ""
+        
+        # safely get item fields with defaults
+        title = html.escape(str(item.get('Ebay product title', 'Unknown')), quote=False)
+        link = str(item.get('Ebay product link', '#'))
+        
+        return (
+            f"- <a href='{link}'>{title}</a>\n"
+            f"  Price: €{price_text} | pot. Profit: <b>€{profit_text}</b>\n\n"
+        )
+    
     @staticmethod
     def build_comparison_data(
         idealo_product: IdealoProduct,
@@ -123,17 +148,6 @@ class TelegramFormatter:
             if not product_name:
                 product_name = 'Unknown Product'
             
-            # separate listings based on is_best_match attribute
-            best_matches = []
-            less_relevant = []
-            
-            if ebay_listings:
-                for listing in ebay_listings:
-                    if hasattr(listing, 'is_best_match') and listing.is_best_match:
-                        best_matches.append(listing)
-                    else:
-                        less_relevant.append(listing)
-            
             # initialize result structure with guaranteed fields
             result = {
                 'idealo_product_title': f"{product_name} - €{product_price:.2f}",
@@ -142,42 +156,41 @@ class TelegramFormatter:
                 'less_relevant_matches': []
             }
             
-            # calculate profitability
-            calc = ProfitabilityCalculator()
+            # profits per listing are plain int subtractions in cents
+            product_cents = to_cents(product_price)
             
-            # process best matches
-            for listing in best_matches[:max_best_matches]:
-                try:
-                    profit = calc.calculate_simple_profit(
-                        product_price,
-                        listing.price if hasattr(listing, 'price') else Decimal('0')
-                    )
-                    result['best_matches'].append({
-                        'Ebay product title': listing.title if hasattr(listing, 'title') else 'Unknown',
-                        'Ebay product link': str(listing.source_url) if hasattr(listing, 'source_url') else '#',
-                        'Ebay product price': float(listing.price) if hasattr(listing, 'price') else 0,
-                        'potential_profit': float(profit)
-                    })
-                except Exception as e:
-                    logger.warning("process_best_match_failed", error=str(e), listing=listing)
-                    continue
-            
-            # process least relevant matches
-            for listing in less_relevant[:max_least_matches]:
+            # one pass over the listings, split by is_best_match until both sections are full
+            best_taken = 0
+            less_taken = 0
+            for listing in ebay_listings or ():
+                if best_taken >= max_best_matches and less_taken >= max_least_matches:
+                    break
+                
+                if listing.is_best_match:
+                    if best_taken >= max_best_matches:
+                        continue
+                    best_taken += 1
+                    section, failure_event = result['best_matches'], "process_best_match_failed"
+                else:
+                    if less_taken >= max_least_matches:
+                        continue
+                    less_taken += 1
+                    section, failure_event = result['less_relevant_matches'], "process_less_relevant_failed"
+                
                 try:
-                    profit = calc.calculate_simple_profit(
-                        product_price,
-                        listing.price if hasattr(listing, 'price') else Decimal('0')
-                    )
-                    result['less_relevant_matches'].append({
-                        'Ebay product title': listing.title if hasattr(listing, 'title') else 'Unknown',
-                        'Ebay product link': str(listing.source_url) if hasattr(listing, 'source_url') else '#',
-                        'Ebay product price': float(listing.price) if hasattr(listing, 'price') else 0,
-                        'potential_profit': float(profit)
+                    listing_cents = to_cents(listing.price)
+                    price = listing_cents / 100
+                    profit = (listing_cents - product_cents) / 100
+                    section.append({
+                        'Ebay product title': listing.title,
+                        'Ebay product link': str(listing.source_url),
+                        'Ebay product price': price,
+                        'potential_profit': profit,
+                        'Ebay product price_fmt': f"{price:.2f}",
+                        'potential_profit_fmt': f"{profit:.2f}"
                     })
                 except Exception as e:
-                    logger.warning("process_less_relevant_failed", error=str(e), listing=listing)
-                    continue
+                    logger.warning(failure_event, error=str(e), listing=listing)
             
             logger.info(
                 "comparison_data_built",
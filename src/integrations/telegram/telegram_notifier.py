@@ -2,20 +2,30 @@
 Telegram notifier for profitable deals after database save.
 """
 
+import logging
+import time
 from typing import List, Optional
 from decimal import Decimal
 
 from src.core.models.ebay_listing import EbayListing
 from src.core.models.idealo_product import IdealoProduct
 from src.core.models.product_comparison import ProductComparison
-from src.integrations.telegram.telegram_client import TelegramClient
+from src.integrations.telegram.telegram_client import (
+    MAX_MESSAGE_LENGTH,
+    TelegramClient,
+    TelegramNotificationError,
+)
 from src.integrations.telegram.telegram_formatter import TelegramFormatter
-from src.shared.config.telegram_settings import get_telegram_config
+from src.shared.config.telegram_settings import TelegramConfig, get_telegram_config
 from src.shared.config.ebay_settings import get_ebay_config
 from src.shared.logging.log_setup import get_logger
 
 logger = get_logger(__name__)
 
+# buffered deals are sent together once the oldest is this old or a message would overflow
+FLUSH_INTERVAL_SECONDS = 3.0
+DEAL_SEPARATOR = "\n\n━━━━━\n\n"
+
 
 class TelegramNotifier:
     """Handles profitable deal notifications after database save."""
@@ -26,15 +36,41 @@ class TelegramNotifier:
         self.formatter = TelegramFormatter()
         self.telegram_config = get_telegram_config()
         self.ebay_config = get_ebay_config()
+        
+        # formatted deals waiting to be sent as one message
+        self._buffer: List[str] = []
+        self._buffer_length = 0
+        self._buffered_since = time.monotonic()
     
-    def send_profitable_deal_notification(
+    @staticmethod
+    def should_notify(comparison: ProductComparison, telegram_config: TelegramConfig) -> bool:
+        """
+        Check whether a comparison warrants a notification at all.
+        
+        Callers should gate queue_profitable_deal_notification on this so the
+        common not-profitable case costs nothing beyond the check.
+        
+        Args:
+            comparison: ProductComparison object with profit calculations
+            telegram_config: Telegram configuration
+            
+        Returns:
+            True if the deal is profitable and Telegram is configured
+        """
+        return comparison.is_profitable and telegram_config.is_configured
+    
+    def queue_profitable_deal_notification(
         self,
         idealo_product: IdealoProduct,
         ebay_listings: List[EbayListing],
         comparison: ProductComparison
     ) -> bool:
         """
-        Send notification for profitable deal after DB save.
+        Queue notification for profitable deal after DB save.
+        
+        Deals are buffered and sent several per message; call close() once
+        the run is done so the last ones are not left behind. Delivery is
+        only known once the buffer is flushed, see flush() and close().
         
         Args:
             idealo_product: The Idealo product found to be profitable
@@ -42,7 +78,7 @@ class TelegramNotifier:
             comparison: ProductComparison object with profit calculations
             
         Returns:
-            True if notification sent successfully, False otherwise
+            True if the deal was queued (not necessarily sent yet), False otherwise
         """
         # only send if profitable
         if not comparison.is_profitable:
@@ -96,38 +132,152 @@ class TelegramNotifier:
             if not message or not message.strip():
                 logger.error(
                     "telegram_message_empty", 
-                    comparison_data=comparison_data,
+                    best_count=len(comparison_data.get('best_matches', [])),
+                    less_relevant_count=len(comparison_data.get('less_relevant_matches', [])),
                     idealo_product=idealo_product.name
                 )
                 message = f"Profitable deal found for {idealo_product.name} with {len(ebay_listings)} listings, but message formatting failed."
             
-            # send notification
-            if self.client.send_notification(message):
-                logger.info(
-                    "telegram_profitable_notification_sent", 
-                    product=idealo_product.name, 
-                    listings_count=len(ebay_listings),
-                    potential_profit=comparison.potential_profit,
-                    profit_percentage=comparison.profit_percentage
-                )
-                return True
-            else:
-                logger.warning(
-                    "telegram_notification_failed",
-                    product=idealo_product.name
-                )
-                return False
+            # queue notification, sending the buffer when it is full or old enough
+            self._enqueue(message)
+            logger.info(
+                "telegram_profitable_notification_queued",
+                product=idealo_product.name,
+                listings_count=len(ebay_listings),
+                potential_profit=comparison.potential_profit,
+                profit_percentage=comparison.profit_percentage
+            )
+            self._maybe_flush()
+            return True
                 
         except Exception as e:
             logger.error(
                 "telegram_notification_error",
                 error=str(e),
                 product=idealo_product.name,
-                exc_info=True
+                # tracebacks only when debugging; formatting them is costly in bulk runs
+                exc_info=logger.is_enabled_for(logging.DEBUG)
             )
             # don't fail the whole process if telegram fails
             return False
     
+    def flush(self) -> bool:
+        """
+        Send all buffered deal notifications.
+        
+        Returns:
+            True if every message was sent (or nothing was buffered), False otherwise
+        """
+        if not self._buffer:
+            return True
+        
+        messages = self._pack(self._buffer)
+        deals_count = len(self._buffer)
+        self._buffer = []
+        self._buffer_length = 0
+        
+        all_sent = True
+        for message in messages:
+            try:
+                if not self.client.send_notification(message):
+                    all_sent = False
+            except TelegramNotificationError as e:
+                logger.warning("telegram_notification_failed", error=str(e))
+                all_sent = False
+        
+        logger.info(
+            "telegram_notifications_flushed",
+            deals_count=deals_count,
+            messages_count=len(messages),
+            all_sent=all_sent
+        )
+        return all_sent
+    
+    def close(self) -> bool:
+        """
+        Send the remaining buffered deals and close the client's HTTP session.
+        
+        Returns:
+            True if every buffered message was sent, False otherwise
+        """
+        try:
+            return self.flush()
+        finally:
+            self.client.close()
+    
+    def _enqueue(self, message: str) -> None:
+        """
+        Add a formatted deal message to the buffer.
+        
+        Args:
+            message: Formatted deal message
+        """
+        # flush first if this deal would not fit next to the buffered ones
+        if self._buffer and self._buffer_length + len(DEAL_SEPARATOR) + len(message) > MAX_MESSAGE_LENGTH:
+            self.flush()
+        
+        if self._buffer:
+            self._buffer_length += len(DEAL_SEPARATOR)
+        else:
+            self._buffered_since = time.monotonic()
+        self._buffer.append(message)
+        self._buffer_length += len(message)
+    
+    def _maybe_flush(self) -> None:
+        """Send the buffer if it is full or its oldest deal waited long enough."""
+        if (
+            self._buffer_length >= MAX_MESSAGE_LENGTH
+            or time.monotonic() - self._buffered_since >= FLUSH_INTERVAL_SECONDS
+        ):
+            self.flush()
+    
+    @staticmethod
+    def _pack(deals: List[str]) -> List[str]:
+        """
+        Join buffered deals into as few messages as fit Telegram's length limit.
+        
+        A deal that is too long on its own is split on line boundaries; the
+        formatter never spans an HTML tag across lines.
+        
+        Args:
+            deals: Formatted deal messages
+            
+        Returns:
+            Messages ready to send, each at most MAX_MESSAGE_LENGTH characters
+        """
+        pieces: List[str] = []
+        for deal in deals:
+            if len(deal) <= MAX_MESSAGE_LENGTH:
+                pieces.append(deal)
+                continue
+            
+            chunk = ""
+            for line in deal.splitlines(keepends=True):
+                if chunk and len(chunk) + len(line) > MAX_MESSAGE_LENGTH:
+                    pieces.append(chunk)
+                    chunk = ""
+                # a single overlong line is left for the client to truncate
+                chunk += line
+            if chunk:
+                pieces.append(chunk)
+        
+        messages: List[str] = []
+        current: List[str] = []
+        current_length = 0
+        for piece in pieces:
+            added_length = len(piece) + (len(DEAL_SEPARATOR) if current else 0)
+            if current and current_length + added_length > MAX_MESSAGE_LENGTH:
+                messages.append(DEAL_SEPARATOR.join(current))
+                current = []
+                current_length = 0
+                added_length = len(piece)
+            current.append(piece)
+            current_length += added_length
+        if current:
+            messages.append(DEAL_SEPARATOR.join(current))
+        
+        return messages
+    
     def check_duplicate_notification(
         self,
         product_id: int,
@@ -0,0 +1,59 @@
+"""
+Unit tests for TelegramNotifier batching.
+"""
+
+from unittest.mock import Mock
+
+from src.integrations.telegram.telegram_client import MAX_MESSAGE_LENGTH
+from src.integrations.telegram.telegram_notifier import DEAL_SEPARATOR, TelegramNotifier
+
+
+class TestTelegramNotifier:
+    """Test buffering and packing of deal notifications."""
+    
+    def test_pack_joins_deals_within_limit(self):
+        """Test small deals share one message and overflow starts a new one."""
+        deal = "x" * 1500
+        
+        messages = TelegramNotifier._pack([deal, deal, deal])
+        
+        assert messages == [deal + DEAL_SEPARATOR + deal, deal]
+        assert all(len(message) <= MAX_MESSAGE_LENGTH for message in messages)
+    
+    def test_pack_splits_long_deal_on_lines(self):
+        """Test a deal over the limit is split between lines, not inside one."""
+        line = "y" * 99 + "\n"
+        deal = line * 50
+        
+        messages = TelegramNotifier._pack([deal])
+        
+        assert "".join(messages) == deal
+        assert all(len(message) <= MAX_MESSAGE_LENGTH for message in messages)
+        assert all(message.endswith("\n") for message in messages)
+    
+    def test_buffered_deals_sent_on_flush(self):
+        """Test queued deals are held until flushed and then sent together."""
+        notifier = TelegramNotifier()
+        notifier.client = Mock()
+        notifier.client.send_notification.return_value = True
+        
+        notifier._enqueue("first")
+        notifier._enqueue("second")
+        
+        notifier.client.send_notification.assert_not_called()
+        assert notifier.flush() is True
+        notifier.client.send_notification.assert_called_once_with("first" + DEAL_SEPARATOR + "second")
+        assert notifier.flush() is True
+        assert notifier.client.send_notification.call_count == 1
+    
+    def test_close_flushes_and_closes_client(self):
+        """Test closing sends the remaining deals and then closes the client session."""
+        notifier = TelegramNotifier()
+        notifier.client = Mock()
+        notifier.client.send_notification.return_value = True
+        
+        notifier._enqueue("last")
+        
+        assert notifier.close() is True
+        notifier.client.send_notification.assert_called_once_with("last")
+        notifier.client.close.assert_called_once_with()
@@ -4,16 +4,22 @@ Parser for extracting eBay listing data from HTML/DOM elements.
 
 import re
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup, Tag
 
 from src.core.exceptions.scraping_errors import ElementNotFoundError, PriceParsingError
 from src.core.models.ebay_listing import EbayListing
 from src.shared.logging.log_setup import get_logger
+from src.shared.utils.price_utils import cents_from_parts, from_cents
 
 logger = get_logger(__name__)
 
+# first number in a price text; currency codes, symbols and range suffixes fall outside it
+_PRICE_NUMBER_RE = re.compile(r'\d[\d.,]*')
+# single-pass translation table for the german decimal format
+_GERMAN_DECIMAL = str.maketrans({'.': '', ',': '.'})
+
 
 class EbayParser:
     """Parser for eBay search results and product listings."""
@@ -22,6 +28,11 @@ class EbayParser:
         """Initialize the parser with selector manager."""
         from .ebay_selectors import selector_manager
         self.selector_manager = selector_manager
+        
+        # all divider texts as one alternation, so an item's text is scanned once
+        self._divider_text_re = re.compile(
+            '|'.join(re.escape(text) for text in selector_manager.get_all_patterns('divider_text'))
+        )
     
     @staticmethod
     def parse_price(price_text: str) -> float:
@@ -34,19 +45,30 @@ class EbayParser:
         Returns:
             Float price value
         """
-        try:
-            # remove currency symbols and extra text
-            cleaned = price_text.replace('EUR', '').replace('$', '').replace('£', '')
-            cleaned = cleaned.replace('€', '').strip()
+        return EbayParser.parse_price_cents(price_text) / 100
+    
+    @staticmethod
+    def parse_price_cents(price_text: str) -> int:
+        """
+        Parse price text to integer cents.
+        
+        Args:
+            price_text: Price string from eBay (e.g., "EUR 29,99", "$19.99")
             
-            # handle range prices (take first value)
-            if ' to ' in cleaned or ' bis ' in cleaned:
-                cleaned = cleaned.split()[0]
+        Returns:
+            Price in cents, 0 if it cannot be parsed
+        """
+        try:
+            # take the first number (the lower bound for range prices)
+            match = _PRICE_NUMBER_RE.search(price_text)
+            if match is None:
+                raise ValueError("no number in price text")
+            cleaned = match.group(0)
             
             # handle german decimal format (comma as decimal separator)
             if ',' in cleaned and '.' in cleaned:
                 # both present - assume german format (1.234,56)
-                cleaned = cleaned.replace('.', '').replace(',', '.')
+                cleaned = cleaned.translate(_GERMAN_DECIMAL)
             elif ',' in cleaned and cleaned.count(',') == 1:
                 # only comma - could be german decimal
                 parts = cleaned.split(',')
@@ -60,10 +82,11 @@ class EbayParser:
                 # just remove any commas (thousands separator)
                 cleaned = cleaned.replace(',', '')
             
-            return float(cleaned)
-        except (ValueError, AttributeError) as e:
+            whole, _, fraction = cleaned.partition('.')
+            return cents_from_parts(whole, fraction)
+        except (ValueError, TypeError) as e:
             logger.warning("price_parse_failed", price_text=price_text, error=str(e))
-            return 0.0
+            return 0
     
     def extract_listing_data(self, item_soup: Tag) -> Optional[Dict[str, Any]]:
         """
@@ -103,15 +126,15 @@ class EbayParser:
                 return None
             
             price_text = price_tag.get_text(strip=True)
-            listing_data['price'] = self.parse_price(price_text)
+            listing_data['price'] = from_cents(self.parse_price_cents(price_text))
             
             # extract URL using selector manager
             url_tag = self.selector_manager.try_selectors(
                 item_soup, 'url', required=True
             )
-            if not url_tag or not url_tag.get('href'):
+            if not url_tag or not (href := url_tag.get('href')):
                 return None
-            listing_data['source_url'] = url_tag['href']
+            listing_data['source_url'] = href
             
             # extract image URL using selector manager
             image_tag = self.selector_manager.try_selectors(
@@ -131,25 +154,19 @@ class EbayParser:
             logger.warning("ebay_listing_parse_failed", error=str(e))
             return None
     
-    def find_listings_on_page(self, soup: BeautifulSoup) -> list:
+    def find_listings_on_page(self, soup: BeautifulSoup, limit: int = 0) -> list:
         """
         Find all listing elements on eBay search results page.
         
         Args:
             soup: BeautifulSoup object of the eBay page
+            limit: Stop after this many listings (0 for no limit)
             
         Returns:
             List of valid listing elements
         """
-        # get all list items from search results
-        container_selector = self.selector_manager.get_all_patterns('results_container')[0]
-        list_items = soup.select(container_selector)
-        valid_listings = []
-        
-        for item in list_items:
-            # use selector manager to check item classes
-            if self.selector_manager.try_class_match(item, 'item_class'):
-                valid_listings.append(item)
+        # product items only, in document order; dividers and ads are filtered by the selector
+        valid_listings = self.selector_manager.select_all(soup, 'result_items', limit)
         
         logger.info("ebay_listings_found_on_page", count=len(valid_listings))
         return valid_listings
@@ -178,45 +195,79 @@ class EbayParser:
         
         return has_no_best_matches
     
-    def find_divider_index(self, soup: BeautifulSoup) -> int:
+    def scan_page(self, soup: BeautifulSoup, limit: int = 0) -> Tuple[List[Tag], int]:
         """
-        Find the index of the divider between best and less relevant matches.
+        Walk the result list once, collecting product items and the divider position.
+        
+        With a limit the walk stops once the divider is known and at least
+        limit items were collected; nothing after that point can change which
+        items a caller taking at most limit of them would pick.
         
         Args:
             soup: BeautifulSoup object of the eBay page
+            limit: Number of items the caller needs at most (0 to scan the whole list)
             
         Returns:
-            Index of divider element or -1 if not found
+            Tuple of (product_elements, divider_index); divider_index is the
+            number of items before the divider, or -1 if there is none
         """
-        container_selector = self.selector_manager.get_all_patterns('results_container')[0]
-        list_items = soup.select(container_selector)
+        list_items = self.selector_manager.iselect_all(soup, 'results_container')
         
-        divider_patterns = self.selector_manager.get_all_patterns('divider_class')
-        text_patterns = self.selector_manager.get_all_patterns('divider_text')
+        divider_classes = self.selector_manager.get_class_set('divider_class')
+        item_classes = self.selector_manager.get_class_set('item_class')
+        
+        divider_index = -1
+        product_elements = []
         
-        item_count = 0
         for idx, item in enumerate(list_items):
-            # check if this is a divider
             class_list = item.get('class')
-            if class_list:
-                for divider_class in divider_patterns:
-                    if divider_class in class_list:
-                        item_text = item.get_text()
-                        # check if it contains the expected text
-                        for text_pattern in text_patterns:
-                            if text_pattern in item_text:
-                                logger.info(
-                                    "divider_found",
-                                    at_index=item_count,
-                                    text_preview=item_text[:100]
-                                )
-                                return item_count
+            if not class_list:
+                continue
+            
+            # read the class list once per item for both checks
+            classes = set(class_list)
             
-            # count actual product items
-            if self.selector_manager.try_class_match(item, 'item_class'):
-                item_count += 1
+            # check for divider element (only the first one counts)
+            if divider_index == -1 and not divider_classes.isdisjoint(classes):
+                item_text = item.get_text()
+                if self._divider_text_re.search(item_text):
+                    divider_index = len(product_elements)
+                    logger.info(
+                        "divider_found",
+                        at_position=idx,
+                        after_items=divider_index,
+                        divider_text=item_text[:100]
+                    )
+                    continue
+            
+            # collect actual product items
+            if not item_classes.isdisjoint(classes):
+                product_elements.append(item)
+                if len(product_elements) <= 3:  # log first few items for debugging
+                    logger.debug(
+                        "product_item_found",
+                        index=idx,
+                        item_number=len(product_elements),
+                        item_id=item.get('id')
+                    )
+                
+                # the rest of the page can't matter once the divider is known and enough items are in
+                if limit and divider_index != -1 and len(product_elements) >= limit:
+                    break
+        
+        return product_elements, divider_index
+    
+    def find_divider_index(self, soup: BeautifulSoup) -> int:
+        """
+        Find the index of the divider between best and less relevant matches.
         
-        return -1
+        Args:
+            soup: BeautifulSoup object of the eBay page
+            
+        Returns:
+            Index of divider element or -1 if not found
+        """
+        return self.scan_page(soup)[1]
     
     def parse_search_result_item(
         self, item_soup: Tag, is_best_match: bool = True
@@ -2,15 +2,20 @@
 Main eBay scraping orchestration and page navigation.
 """
 
-import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
 
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import SoupStrainer
 from seleniumbase import SB
 
-from src.core.exceptions.scraping_errors import PageLoadError, ScrapingError
+from src.core.exceptions.scraping_errors import ScrapingError
 from src.core.models.ebay_listing import EbayListing
 from src.shared.config.ebay_settings import get_ebay_config
 from src.shared.logging.log_setup import get_logger, log_scraping_progress
+from src.shared.utils.html_parsing import make_soup
 
 from .ebay_parser import EbayParser
 from .ebay_scraper_utils import EbayScraperUtils
@@ -18,6 +23,26 @@ from .ebay_selectors import selector_manager
 
 logger = get_logger(__name__)
 
+# classes of the only page regions the scan reads: the results list and the no-results banner
+_RESULT_REGION_CLASSES = frozenset({'srp-results', 'srp-save-null-search__title'})
+
+
+def _is_result_region(class_value: Optional[str]) -> bool:
+    """
+    Check a raw class attribute for one of the result region classes.
+    
+    Args:
+        class_value: Unsplit class attribute value, None if absent
+        
+    Returns:
+        True if the tag belongs to a result region
+    """
+    return class_value is not None and not _RESULT_REGION_CLASSES.isdisjoint(class_value.split())
+
+
+# build only the result regions instead of the whole page (header, nav, footer, ads)
+RESULTS_STRAINER = SoupStrainer(['ul', 'div'], attrs={'class': _is_result_region})
+
 
 class EbayScraper:
     """
@@ -27,6 +52,16 @@ class EbayScraper:
     with parser and utility modules for data extraction.
     """
     
+    HTTP_HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+        ),
+        "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
+    }
+    # present in server-rendered search pages, missing on bot walls
+    RESULTS_MARKER = "srp-results"
+    
     def __init__(self):
         """Initialize eBay scraper with configuration."""
         self.config = get_ebay_config()
@@ -64,6 +99,7 @@ class EbayScraper:
         
         Flow:
         - Single search with filters applied upfront (min price, sorted by price)
+        - Plain HTTP fetch first, browser only if the results list is missing
         - If best matches exist → take MAX_BESTMATCH_ITEMS
         - If no best matches → take MAX_LEASTMATCH_ITEMS
         
@@ -74,88 +110,205 @@ class EbayScraper:
         Returns:
             List of EbayListing objects
         """
+        return self.search_many([search_query])[search_query]
+    
+    def search_many(self, search_queries: List[str]) -> Dict[str, List[EbayListing]]:
+        """
+        Search eBay for several queries concurrently.
+        
+        Search pages are static HTML, so they are fetched over a shared HTTP
+        session with up to EBAY_MAX_CONCURRENCY requests in flight. Queries
+        whose HTML lacks the results list are retried one by one in a browser.
+        
+        Args:
+            search_queries: Product search queries
+            
+        Returns:
+            Dictionary mapping each query to its listings (empty if the search failed)
+        """
+        queries = list(dict.fromkeys(search_queries))
+        results: Dict[str, List[EbayListing]] = {}
+        if not queries:
+            return results
+        
         logger.info(
-            "starting_ebay_search", 
-            query=search_query,
+            "starting_ebay_search",
+            queries=len(queries),
+            max_concurrency=self.config.EBAY_MAX_CONCURRENCY,
             max_bestmatch=self.config.MAX_BESTMATCH_ITEMS,
             max_leastmatch=self.config.MAX_LEASTMATCH_ITEMS,
             min_price=self.config.EBAY_MIN_PRICE
         )
-        print(f"--- Starting eBay scrape for '{search_query}' ---")
         
-        with SB(uc=True, headless=self.config.IS_HEADLESS_EBAY) as sb:
-            try:
-                # build and navigate to search URL with all filters
-                search_url = self._build_search_url(search_query)
-                print(f"\n--- Opening URL: {search_url} ---")
-                logger.debug("navigating_to_search", url=search_url)
-                
-                sb.open(search_url)
-                logger.debug("page_loaded", current_url=sb.get_current_url())
-                time.sleep(2)
-                
-                # handle cookie consent
+        urls = {query: self._build_search_url(query) for query in queries}
+        browser_queries = []
+        
+        with requests.Session() as session:
+            session.headers.update(self.HTTP_HEADERS)
+            # one pooled connection per worker instead of requests' default of 10
+            adapter = HTTPAdapter(pool_maxsize=self.config.EBAY_MAX_CONCURRENCY)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            workers = min(self.config.EBAY_MAX_CONCURRENCY, len(queries))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    query: executor.submit(self._fetch_html, session, url)
+                    for query, url in urls.items()
+                }
+                for query, future in futures.items():
+                    html = future.result()
+                    if html is None:
+                        browser_queries.append(query)
+                        continue
+                    try:
+                        results[query] = self._extract_listings(make_soup(html, RESULTS_STRAINER), query)
+                    except ScrapingError as e:
+                        logger.warning("ebay_http_search_failed", query=query, error=str(e))
+                        results[query] = []
+        
+        # pages that need JavaScript share one warm browser, one at a time
+        if browser_queries:
+            with SB(uc=True, headless=self.config.IS_HEADLESS_EBAY) as sb:
+                cookies_handled = False
+                for query in browser_queries:
+                    logger.info("ebay_browser_fallback", query=query)
+                    try:
+                        results[query] = self._search_with_browser(
+                            sb, query, urls[query], handle_cookies=not cookies_handled
+                        )
+                        cookies_handled = True
+                    except ScrapingError as e:
+                        logger.warning("ebay_browser_search_failed", query=query, error=str(e))
+                        results[query] = []
+        
+        return results
+    
+    def _fetch_html(self, session: requests.Session, url: str) -> Optional[str]:
+        """
+        Fetch a search page over plain HTTP.
+        
+        Args:
+            session: Shared HTTP session
+            url: eBay search URL
+            
+        Returns:
+            Page HTML, or None if the request failed or the page has no results list
+        """
+        try:
+            response = session.get(url, timeout=self.config.PAGE_LOAD_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("ebay_http_fetch_failed", url=url, error=str(e))
+            return None
+        
+        html = response.text
+        if self.RESULTS_MARKER not in html:
+            logger.debug("ebay_http_results_missing", url=url)
+            return None
+        return html
+    
+    def _search_with_browser(
+        self,
+        sb,
+        search_query: str,
+        search_url: str,
+        handle_cookies: bool = True
+    ) -> List[EbayListing]:
+        """
+        Load a search page in an open browser and extract listings.
+        
+        Args:
+            sb: SeleniumBase driver instance, reused across searches
+            search_query: Product search query
+            search_url: eBay search URL
+            handle_cookies: Whether to dismiss the cookie banner (first page only)
+            
+        Returns:
+            List of EbayListing objects
+            
+        Raises:
+            ScrapingError: If the search fails
+        """
+        try:
+            logger.debug("navigating_to_search", url=search_url)
+            
+            sb.open(search_url)
+            sb.wait_for_element_present(
+                self.utils.RESULTS_READY_SELECTOR,
+                timeout=self.config.PAGE_LOAD_TIMEOUT
+            )
+            logger.debug("page_loaded", current_url=sb.get_current_url())
+            
+            # consent is stored in the browser session, so only the first page needs it
+            if handle_cookies:
                 logger.debug("handling_cookie_consent")
                 self.utils.handle_cookie_consent(sb)
                 logger.debug("cookie_consent_handled")
-                time.sleep(1)
-                
-                # analyze search results
-                logger.info("analyzing_search_results")
-                has_no_best_matches, divider_index, item_count = self._analyze_search_results(sb)
-                
-                # two-branch logic
-                if has_no_best_matches or divider_index == -1:
-                    # no best matches found - take least relevant items
-                    logger.info(
-                        "no_best_matches_branch",
-                        item_count=item_count,
-                        will_take=min(item_count, self.config.MAX_LEASTMATCH_ITEMS)
-                    )
-                    print(f"--- No best matches found. Taking up to {self.config.MAX_LEASTMATCH_ITEMS} items ---")
-                    
-                    elements = self._get_search_result_elements(sb)
-                    listings = self._parse_elements(
-                        elements[:self.config.MAX_LEASTMATCH_ITEMS],
-                        is_best_match=False
-                    )
-                    
-                    logger.info(
-                        "search_completed",
-                        branch="no_best_matches",
-                        listings_count=len(listings)
-                    )
-                else:
-                    # best matches exist - take best match items
-                    best_match_count = divider_index if divider_index > 0 else item_count
-                    logger.info(
-                        "best_matches_branch",
-                        best_match_count=best_match_count,
-                        will_take=min(best_match_count, self.config.MAX_BESTMATCH_ITEMS)
-                    )
-                    print(f"--- Best matches found. Taking up to {self.config.MAX_BESTMATCH_ITEMS} items ---")
-                    
-                    elements = self._get_search_result_elements(sb)
-                    listings = self._parse_elements(
-                        elements[:self.config.MAX_BESTMATCH_ITEMS],
-                        is_best_match=True
-                    )
-                    
-                    logger.info(
-                        "search_completed",
-                        branch="best_matches",
-                        listings_count=len(listings)
-                    )
-                
-                return listings
-                
-            except Exception as e:
-                logger.error(
-                    "ebay_search_failed",
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
-                raise ScrapingError("eBay search failed", str(e))
+            
+            return self._extract_listings(make_soup(sb.get_page_source(), RESULTS_STRAINER), search_query)
+            
+        except Exception as e:
+            logger.error(
+                "ebay_search_failed",
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            raise ScrapingError("eBay search failed", str(e))
+    
+    def _extract_listings(self, soup, search_query: str) -> List[EbayListing]:
+        """
+        Pick best-match or least-match items from a search page and parse them.
+        
+        Args:
+            soup: BeautifulSoup object of the search page
+            search_query: Product search query, for logging
+            
+        Returns:
+            List of EbayListing objects
+        """
+        # analyze search results
+        logger.info("analyzing_search_results", query=search_query)
+        has_no_best_matches, divider_index, elements = self._scan_search_results(soup)
+        item_count = len(elements)
+        
+        # two-branch logic
+        if has_no_best_matches or divider_index == -1:
+            # no best matches found - take least relevant items
+            logger.info(
+                "no_best_matches_branch",
+                item_count=item_count,
+                will_take=min(item_count, self.config.MAX_LEASTMATCH_ITEMS)
+            )
+            listings = self._parse_elements(
+                elements[:self.config.MAX_LEASTMATCH_ITEMS],
+                is_best_match=False
+            )
+            
+            logger.info(
+                "search_completed",
+                branch="no_best_matches",
+                listings_count=len(listings)
+            )
+        else:
+            # best matches exist - take best match items
+            best_match_count = divider_index if divider_index > 0 else item_count
+            logger.info(
+                "best_matches_branch",
+                best_match_count=best_match_count,
+                will_take=min(best_match_count, self.config.MAX_BESTMATCH_ITEMS)
+            )
+            listings = self._parse_elements(
+                elements[:min(best_match_count, self.config.MAX_BESTMATCH_ITEMS)],
+                is_best_match=True
+            )
+            
+            logger.info(
+                "search_completed",
+                branch="best_matches",
+                listings_count=len(listings)
+            )
+        
+        return listings
     
     def _build_search_url(self, query: str) -> str:
         """
@@ -167,8 +320,6 @@ class EbayScraper:
         Returns:
             Complete eBay search URL with filters
         """
-        from urllib.parse import urlencode
-        
         params = {
             "_nkw": query,
             "_from": "R40",
@@ -179,57 +330,20 @@ class EbayScraper:
             "_udlo": str(self.config.EBAY_MIN_PRICE)  # always apply min price filter
         }
         
-        return f"https://www.ebay.de/sch/i.html?{urlencode(params)}"
+        return f"{self.utils.BASE_URL}?{urlencode(params)}"
     
-    def _wait_for_search_results(self, sb):
-        """Wait for search results to load."""
-        try:
-            # wait for results container
-            sb.wait_for_element("ul.srp-results", timeout=10)
-            
-            # additional wait for dynamic content
-            time.sleep(2)
-            
-        except Exception as e:
-            logger.error("search_results_not_loaded", error=str(e))
-            raise PageLoadError("eBay search results failed to load", str(e))
-    
-    def _get_search_result_elements(self, sb):
-        """Get search result elements from the page."""
-        try:
-            soup = sb.get_beautiful_soup()
-            
-            # get all list items from search results
-            container_selector = self.selector_manager.get_all_patterns('results_container')[0]
-            list_items = soup.select(container_selector)
-            
-            # filter to only get items with product class (s-card or s-item)
-            product_elements = []
-            for item in list_items:
-                if self.selector_manager.try_class_match(item, 'item_class'):
-                    product_elements.append(item)
-            
-            return product_elements
-            
-        except Exception as e:
-            logger.error("failed_to_get_search_elements", error=str(e))
-            raise ScrapingError("Failed to get eBay search elements", str(e))
-    
-    def _analyze_search_results(self, sb) -> tuple[bool, int, int]:
+    def _scan_search_results(self, soup) -> tuple[bool, int, list]:
         """
-        Analyze search results to determine match types and counts.
+        Walk the result list once, collecting product items and the divider position.
         
         Args:
-            sb: SeleniumBase driver instance
+            soup: BeautifulSoup object of the search page
             
         Returns:
-            Tuple of (has_no_best_matches, divider_index, item_count)
+            Tuple of (has_no_best_matches, divider_index, product_elements)
         """
         logger.debug("starting_result_analysis")
         
-        # get page soup for analysis
-        soup = sb.get_beautiful_soup()
-        
         # check if no best matches found using selector manager
         no_match_element = self.selector_manager.try_selectors(
             soup, 'no_results', required=False
@@ -242,50 +356,15 @@ class EbayScraper:
                 element_text=no_match_element.get_text(strip=True) if no_match_element else None
             )
         
-        # get all list items and find divider
-        container_selector = self.selector_manager.get_all_patterns('results_container')[0]
-        list_items = soup.select(container_selector)
-        logger.debug("total_list_items_found", count=len(list_items))
-        
-        divider_index = -1
-        item_count = 0
-        
-        # get divider patterns
-        divider_classes = self.selector_manager.get_all_patterns('divider_class')
-        divider_texts = self.selector_manager.get_all_patterns('divider_text')
-        
-        for idx, item in enumerate(list_items):
-            class_list = item.get('class')
-            # check for divider element
-            if class_list:
-                for divider_class in divider_classes:
-                    if divider_class in class_list:
-                        item_text = item.get_text()
-                        # check if it contains the expected text
-                        for divider_text in divider_texts:
-                            if divider_text in item_text:
-                                divider_index = item_count
-                                logger.info(
-                                    "divider_found",
-                                    at_position=idx,
-                                    after_items=item_count,
-                                    divider_text=item_text[:100]
-                                )
-                                break
-                        if divider_index != -1:
-                            break
-            
-            # count actual product items using selector manager
-            if self.selector_manager.try_class_match(item, 'item_class'):
-                item_count += 1
-                if item_count <= 3:  # log first few items for debugging
-                    logger.debug(
-                        "product_item_found",
-                        index=idx,
-                        item_number=item_count,
-                        item_id=item.get('id')
-                    )
+        try:
+            # either branch below takes at most this many items
+            limit = max(self.config.MAX_BESTMATCH_ITEMS, self.config.MAX_LEASTMATCH_ITEMS)
+            product_elements, divider_index = self.parser.scan_page(soup, limit)
+        except Exception as e:
+            logger.error("failed_to_get_search_elements", error=str(e))
+            raise ScrapingError("Failed to get eBay search elements", str(e))
         
+        item_count = len(product_elements)
         logger.info(
             "search_results_analyzed",
             has_no_best=has_no_best_matches,
@@ -295,7 +374,7 @@ class EbayScraper:
             least_match_count=item_count - divider_index if divider_index != -1 else 0
         )
         
-        return has_no_best_matches, divider_index, item_count
+        return has_no_best_matches, divider_index, product_elements
     
     def _parse_elements(
         self, elements: list, is_best_match: bool
@@ -313,12 +392,9 @@ class EbayScraper:
         listings = []
         total = len(elements)
         
-        print(f"Parsing {total} eBay listings...")
+        logger.debug("parsing_listings", total=total)
         
         for i, element in enumerate(elements):
-            if i % 5 == 0 or i == total - 1:
-                print(f"Parsing listings: {i+1}/{total}...")
-            
             try:
                 listing = self.parser.parse_search_result_item(element, is_best_match)
                 if listing:
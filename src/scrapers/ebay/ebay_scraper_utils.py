@@ -2,7 +2,6 @@
 Handle eBay-specific elements like cookie consent and search parameters.
 """
 
-import time
 from typing import Optional
 from urllib.parse import urlencode
 
@@ -18,6 +17,8 @@ class EbayScraperUtils:
     """Handles eBay-specific browser interactions and search logic."""
     
     BASE_URL = "https://www.ebay.de/sch/i.html"
+    # either a results list or the "no exact matches" banner means the page is ready
+    RESULTS_READY_SELECTOR = "ul.srp-results, div.srp-save-null-search__title"
     
     @staticmethod
     def handle_cookie_consent(sb) -> bool:
@@ -92,7 +93,7 @@ class EbayScraperUtils:
         
         try:
             sb.open(search_url)
-            time.sleep(2)  # original timing
+            sb.wait_for_element_present(EbayScraperUtils.RESULTS_READY_SELECTOR, timeout=15)
             
             logger.info("ebay_search_page_loaded")
             return True
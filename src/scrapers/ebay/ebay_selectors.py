@@ -6,7 +6,9 @@ organized by element type with fallback alternatives.
 Add new selectors at the beginning of each list for priority.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+import soupsieve as sv
 from bs4 import BeautifulSoup, Tag
 
 from src.shared.logging.log_setup import get_logger
@@ -83,6 +85,51 @@ SELECTORS: Dict[str, List[str]] = {
 }
 
 
+# product items inside the results container, one compound selector over all item classes
+# so matching happens inside soupsieve instead of a python loop over every li
+SELECTORS['result_items'] = [
+    ', '.join(
+        f"{SELECTORS['results_container'][0]}.{item_class}"
+        for item_class in SELECTORS['item_class']
+    ),
+]
+
+
+# keys whose patterns are CSS selectors (the rest are class names / text)
+CSS_SELECTOR_KEYS = (
+    'title', 'subtitle', 'price', 'url', 'image', 'results_container', 'result_items', 'no_results'
+)
+
+# compile every CSS selector once at import instead of on each select_one call
+COMPILED_SELECTORS: Dict[str, sv.SoupSieve] = {
+    selector: sv.compile(selector)
+    for key in CSS_SELECTOR_KEYS
+    for selector in SELECTORS[key]
+}
+
+
+# keys whose patterns are class names, kept as sets for O(1) membership checks
+CLASS_PATTERN_SETS: Dict[str, frozenset] = {
+    key: frozenset(SELECTORS[key]) for key in ('item_class', 'divider_class')
+}
+
+
+def compiled(selector: str) -> sv.SoupSieve:
+    """
+    Get the pre-compiled matcher for a CSS selector, compiling it if unknown.
+    
+    Args:
+        selector: CSS selector string
+        
+    Returns:
+        Compiled soupsieve matcher
+    """
+    matcher = COMPILED_SELECTORS.get(selector)
+    if matcher is None:
+        matcher = COMPILED_SELECTORS[selector] = sv.compile(selector)
+    return matcher
+
+
 class SelectorManager:
     """
     Manages CSS selectors with automatic fallback functionality.
@@ -115,7 +162,7 @@ class SelectorManager:
         # check cache first
         if selector_key in self._successful_selectors:
             cached_selector = self._successful_selectors[selector_key]
-            result = soup.select_one(cached_selector)
+            result = compiled(cached_selector).select_one(soup)
             if result:
                 return result
             # cached selector failed, clear it
@@ -139,7 +186,7 @@ class SelectorManager:
                 continue
                 
             try:
-                result = soup.select_one(selector)
+                result = compiled(selector).select_one(soup)
                 if result:
                     # cache successful selector
                     self._successful_selectors[selector_key] = selector
@@ -197,18 +244,56 @@ class SelectorManager:
         if not isinstance(class_list, list):
             return False
         
-        patterns = SELECTORS.get(class_key, [])
-        for pattern in patterns:
-            if pattern in class_list:
-                if pattern != patterns[0]:  # using fallback
-                    logger.debug(
-                        "using_fallback_class_pattern",
-                        pattern=pattern,
-                        index=patterns.index(pattern)
-                    )
-                return True
+        if self.get_class_set(class_key).isdisjoint(class_list):
+            return False
+        
+        patterns = SELECTORS[class_key]
+        if patterns[0] not in class_list:  # using fallback
+            pattern = next(p for p in patterns if p in class_list)
+            logger.debug(
+                "using_fallback_class_pattern",
+                pattern=pattern,
+                index=patterns.index(pattern)
+            )
+        return True
+    
+    def select_all(
+        self, soup: BeautifulSoup | Tag, selector_key: str, limit: int = 0
+    ) -> List[Tag]:
+        """
+        Select all elements matching the primary selector for a key.
+        
+        Args:
+            soup: BeautifulSoup object or Tag to search in
+            selector_key: Key from SELECTORS dict (e.g., 'results_container')
+            limit: Stop after this many matches (0 for no limit)
+            
+        Returns:
+            List of matching elements
+        """
+        return list(self.iselect_all(soup, selector_key, limit))
+    
+    def iselect_all(
+        self, soup: BeautifulSoup | Tag, selector_key: str, limit: int = 0
+    ) -> Iterator[Tag]:
+        """
+        Lazily yield elements matching the primary selector for a key.
+        
+        Matching stops as soon as the caller stops iterating.
         
-        return False
+        Args:
+            soup: BeautifulSoup object or Tag to search in
+            selector_key: Key from SELECTORS dict (e.g., 'results_container')
+            limit: Stop after this many matches (0 for no limit)
+            
+        Returns:
+            Iterator over matching elements
+        """
+        selectors = SELECTORS.get(selector_key, [])
+        if not selectors:
+            logger.warning("no_selectors_defined", key=selector_key)
+            return iter(())
+        return compiled(selectors[0]).iselect(soup, limit=limit)
     
     def get_all_patterns(self, pattern_key: str) -> List[str]:
         """
@@ -222,6 +307,21 @@ class SelectorManager:
         """
         return SELECTORS.get(pattern_key, [])
     
+    def get_class_set(self, pattern_key: str) -> frozenset:
+        """
+        Get the class name patterns for a key as a set.
+        
+        Args:
+            pattern_key: Key from SELECTORS dict holding class names (e.g., 'item_class')
+            
+        Returns:
+            Frozen set of class names
+        """
+        class_set = CLASS_PATTERN_SETS.get(pattern_key)
+        if class_set is None:
+            class_set = CLASS_PATTERN_SETS[pattern_key] = frozenset(SELECTORS.get(pattern_key, []))
+        return class_set
+    
     def clear_cache(self):
         """Clear the selector cache (useful when page structure changes)."""
         self._successful_selectors.clear()
@@ -7,13 +7,30 @@ from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, Optional
 import json
 
+import soupsieve as sv
 from bs4 import BeautifulSoup, Tag
 
 from src.core.exceptions.scraping_errors import ElementNotFoundError, PriceParsingError
 from src.shared.logging.log_setup import get_logger
+from src.shared.utils.price_utils import cents_from_parts, from_cents
 
 logger = get_logger(__name__)
 
+# compiled once here instead of looked up in re's cache on every card
+_PRICE_RE = re.compile(r'[\d,.]+')
+_DIGITS_RE = re.compile(r'\d+')
+
+# product card selectors, compiled once at import
+RESULTS_CONTAINER_SELECTOR = 'div[class*="sr-resultList"]'
+PRODUCT_CARD_SELECTOR = 'div[class*="sr-resultList__item"]'
+_PRODUCT_CARD = sv.compile(PRODUCT_CARD_SELECTOR)
+_TITLE = sv.compile('div[class*="sr-productSummary__title"]')
+_LINK = sv.compile('a[class*="sr-resultItemTile__link"]')
+_WISHLIST = sv.compile('[data-wishlist-heart]')
+_PRICE = sv.compile('div[class*="sr-detailedPriceInfo__price"]')
+_IMAGE = sv.compile('img[class*="sr-resultItemTile__image"]')
+_DISCOUNT = sv.compile('span[class*="sr-bargainBadge__savingBadge"]')
+
 
 class IdealoParser:
     """Handles parsing of Idealo product data from HTML."""
@@ -33,12 +50,13 @@ class IdealoParser:
             PriceParsingError: If price cannot be parsed
         """
         try:
-            price_match = re.search(r'[\d,.]+', price_text)
+            price_match = _PRICE_RE.search(price_text)
             if not price_match:
                 raise PriceParsingError(price_text)
             
-            price_cleaned = price_match.group(0).replace('.', '').replace(',', '.')
-            return Decimal(price_cleaned)
+            # german format: '.' groups thousands, ',' separates cents
+            whole, _, fraction = price_match.group(0).replace('.', '').partition(',')
+            return from_cents(cents_from_parts(whole, fraction))
             
         except (InvalidOperation, ValueError) as e:
             logger.error("price_parsing_failed", price_text=price_text, error=str(e))
@@ -56,7 +74,7 @@ class IdealoParser:
             Discount as Decimal (e.g., 0.25 for 25%) or None if not found
         """
         try:
-            discount_match = re.search(r'\d+', discount_text)
+            discount_match = _DIGITS_RE.search(discount_text)
             if discount_match:
                 # convert percentage to decimal (25% -> 0.25)
                 discount_percent = int(discount_match.group(0))
@@ -82,7 +100,7 @@ class IdealoParser:
             product_data = {}
             
             # extract title using actual selector
-            title_tag = card.select_one('div[class*="sr-productSummary__title"]')
+            title_tag = _TITLE.select_one(card)
             if not title_tag:
                 return None
             product_data['name'] = title_tag.get_text(strip=True)
@@ -91,7 +109,7 @@ class IdealoParser:
             source_url = "N/A"
             
             # method 1: direct link
-            link_tag = card.select_one('a[class*="sr-resultItemTile__link"]')
+            link_tag = _LINK.select_one(card)
             if link_tag and link_tag.get("href"):
                 raw_url = str(link_tag.get("href"))
                 if raw_url and not raw_url.startswith("https://"):
@@ -101,7 +119,7 @@ class IdealoParser:
             
             # method 2: wishlist data (from original code)
             if "ipc/prg" in source_url or source_url == "N/A":
-                wishlist_tag = card.select_one("[data-wishlist-heart]")
+                wishlist_tag = _WISHLIST.select_one(card)
                 if wishlist_tag:
                     wishlist_attr = wishlist_tag.get("data-wishlist-heart")
                     if wishlist_attr:
@@ -114,20 +132,20 @@ class IdealoParser:
                             )
             
             # extract price using actual selector
-            price_tag = card.select_one('div[class*="sr-detailedPriceInfo__price"]')
+            price_tag = _PRICE.select_one(card)
             if not price_tag:
                 return None
             product_data['price'] = IdealoParser.parse_price(price_tag.get_text(strip=True))
             
             # extract image URL using actual selector
-            image_tag = card.select_one('img[class*="sr-resultItemTile__image"]')
+            image_tag = _IMAGE.select_one(card)
             if image_tag:
                 product_data['image_url'] = image_tag.get("data-src") or image_tag.get("src")
             else:
                 product_data['image_url'] = None
             
             # extract discount using actual selector
-            discount_tag = card.select_one('span[class*="sr-bargainBadge__savingBadge"]')
+            discount_tag = _DISCOUNT.select_one(card)
             if discount_tag:
                 product_data['discount'] = IdealoParser.parse_discount(
                     discount_tag.get_text(strip=True)
@@ -170,7 +188,7 @@ class IdealoParser:
             List of product elements
         """
         # use actual selector from original code
-        products = soup.select('div[class*="sr-resultList__item"]')
+        products = _PRODUCT_CARD.select(soup)
         
         logger.info("products_found_on_page", count=len(products))
         return products
@@ -183,4 +201,4 @@ class IdealoParser:
         Returns:
             Selector string for results container
         """
-        return 'div[class*="sr-resultList"]'
\ No newline at end of file
+        return RESULTS_CONTAINER_SELECTOR
\ No newline at end of file
@@ -11,6 +11,7 @@ from src.core.exceptions.scraping_errors import PageLoadError, ScrapingError
 from src.core.models.idealo_product import IdealoProduct
 from src.shared.config.idealo_settings import get_idealo_config
 from src.shared.logging.log_setup import get_logger, log_scraping_progress
+from src.shared.utils.html_parsing import make_soup
 
 from .idealo_scraper_utils import IdealoScraperUtils
 from .idealo_parser import IdealoParser
@@ -74,7 +75,7 @@ class IdealoScraper:
         try:
             sb.open(self.config.SCRAPE_URL_IDEALO)
             
-            if not self.utils.wait_for_page_load(sb):
+            if not self.utils.wait_for_page_load(sb, timeout=self.config.PAGE_LOAD_TIMEOUT):
                 raise PageLoadError(
                     self.config.SCRAPE_URL_IDEALO,
                     "Page failed to load within timeout"
@@ -98,8 +99,6 @@ class IdealoScraper:
         all_products = []
         
         for page_num in range(1, max_pages + 1):
-            print(f"Scraping page {page_num}/{max_pages}...")
-            
             log_scraping_progress(
                 logger,
                 "scraping_page",
@@ -111,13 +110,11 @@ class IdealoScraper:
             page_products = self._scrape_current_page(sb, page_num)
             all_products.extend(page_products)
             
-            print(f"Found {len(page_products)} products on page {page_num}")
-            
             # navigate to next page if not the last page
             if page_num < max_pages:
                 # add a small delay between pages to avoid rate limiting
                 time.sleep(2)
-                if not self.utils.navigate_to_next_page(sb):
+                if not self.utils.navigate_to_next_page(sb, timeout=self.config.PAGE_LOAD_TIMEOUT):
                     logger.warning("early_pagination_end", page=page_num)
                     break
         
@@ -137,10 +134,10 @@ class IdealoScraper:
         page_products = []
         
         # scroll to load all products on page
-        self.utils.scroll_to_load_products(sb)
+        self.utils.scroll_to_load_products(sb, timeout=self.config.ELEMENT_WAIT_TIMEOUT)
         
         # get page content and parse products
-        soup = sb.get_beautiful_soup()
+        soup = make_soup(sb.get_page_source())
         product_elements = self.parser.find_products_on_page(soup)
         
         logger.info("parsing_products", page=page_num, count=len(product_elements))
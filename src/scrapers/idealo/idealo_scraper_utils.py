@@ -6,17 +6,25 @@ import time
 from pathlib import Path
 from typing import Optional
 
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from seleniumbase import SB
 
 from src.core.exceptions.scraping_errors import CookieConsentError, ElementNotFoundError
 from src.shared.logging.log_setup import get_logger
 
+from .idealo_parser import PRODUCT_CARD_SELECTOR, RESULTS_CONTAINER_SELECTOR
+
 logger = get_logger(__name__)
 
 
 class IdealoScraperUtils:
     """Handles Idealo-specific browser interactions."""
     
+    NEXT_PAGE_SELECTOR = 'a[aria-label="Nächste Seite"]'
+    
     @staticmethod
     def ensure_screenshot_dir() -> Path:
         """
@@ -73,26 +81,29 @@ class IdealoScraperUtils:
             raise CookieConsentError(f"Failed to handle cookie consent: {str(e)}")
     
     @staticmethod
-    def navigate_to_next_page(sb) -> bool:
+    def navigate_to_next_page(sb, timeout: int = 15) -> bool:
         """
         Navigate to the next page of results.
         
         Args:
             sb: SeleniumBase driver instance
+            timeout: Seconds to wait for the next page's results
             
         Returns:
             True if navigation was successful, False if no next page
         """
         try:
-            # scroll to pagination area first
-            sb.slow_scroll_to('a[aria-label="Nächste Seite"]')
-            time.sleep(2)
+            # jump to pagination area first
+            sb.scroll_to(IdealoScraperUtils.NEXT_PAGE_SELECTOR)
             
             # check if next page button exists and is clickable
-            next_button = sb.find_element('a[aria-label="Nächste Seite"]')
+            next_button = sb.find_element(IdealoScraperUtils.NEXT_PAGE_SELECTOR)
             if next_button and "disabled" not in next_button.get_attribute("class"):
-                sb.click('a[aria-label="Nächste Seite"]')
-                time.sleep(3)  # wait for page load
+                # remember a node of the current page to detect when it is replaced
+                old_results = sb.find_element(RESULTS_CONTAINER_SELECTOR)
+                sb.click(IdealoScraperUtils.NEXT_PAGE_SELECTOR)
+                WebDriverWait(sb.driver, timeout).until(EC.staleness_of(old_results))
+                sb.wait_for_element_present(RESULTS_CONTAINER_SELECTOR, timeout=timeout)
                 logger.info("navigated_to_next_page")
                 return True
             else:
@@ -117,10 +128,7 @@ class IdealoScraperUtils:
         """
         try:
             # wait for product container to be visible (using correct selector)
-            sb.wait_for_element_present('div[class*="sr-resultList"]', timeout=timeout)
-            
-            # additional wait for dynamic content
-            time.sleep(2)
+            sb.wait_for_element_present(RESULTS_CONTAINER_SELECTOR, timeout=timeout)
             
             logger.info("page_loaded_successfully")
             return True
@@ -130,21 +138,44 @@ class IdealoScraperUtils:
             return False
     
     @staticmethod
-    def scroll_to_load_products(sb) -> None:
+    def scroll_to_load_products(sb, timeout: int = 15, poll_interval: float = 0.5) -> None:
         """
         Scroll down the page to trigger lazy loading of products.
         
+        Loading counts as finished once the number of product cards stops
+        growing between two polls.
+        
         Args:
             sb: SeleniumBase driver instance
+            timeout: Seconds to wait for the results list and the lazy-loaded cards
+            poll_interval: Seconds between two product card counts
         """
         logger.debug("scrolling_to_load_products")
         
-        # scroll slowly to the bottom to load all products (following working code pattern)
-        time.sleep(2)
-        sb.slow_scroll_to('a[aria-label="Nächste Seite"]')
-        time.sleep(2)
+        # wait for the DOM instead of sleeping a fixed time around the scroll
+        sb.wait_for_element_present(RESULTS_CONTAINER_SELECTOR, timeout=timeout)
+        try:
+            sb.scroll_to(IdealoScraperUtils.NEXT_PAGE_SELECTOR)
+        except Exception as e:
+            # last page has no pagination link
+            logger.debug("pagination_link_not_found", error=str(e))
+            sb.scroll_to_bottom()
+        
+        counts = [-1]
+        
+        def cards_settled(driver) -> bool:
+            count = len(driver.find_elements(By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR))
+            settled = count > 0 and count == counts[-1]
+            counts.append(count)
+            return settled
+        
+        try:
+            WebDriverWait(sb.driver, timeout, poll_frequency=poll_interval).until(cards_settled)
+        except TimeoutException:
+            # parse whatever has loaded rather than failing the page
+            logger.warning("product_cards_not_settled", count=counts[-1], timeout=timeout)
         
-        logger.debug("scrolling_completed")
+        logger.debug("scrolling_completed", product_cards=counts[-1])
     
     @staticmethod
     def get_current_page_number(sb) -> Optional[int]:
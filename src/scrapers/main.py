@@ -16,6 +16,7 @@ from src.core.models.ebay_listing import EbayListing
 from src.core.models.idealo_product import IdealoProduct
 from src.core.models.product_comparison import ProductComparison
 from src.core.utils.profitability_calculator import ProfitabilityCalculator
+from src.database.handlers.connection_handler import close_pool
 from src.database.repositories.ebay_listing_repository import EbayListingRepository
 from src.database.repositories.idealo_product_repository import IdealoProductRepository
 from src.scrapers.ebay.ebay_scraper import EbayScraper
@@ -86,35 +87,32 @@ def run_ebay_scraper(search_query: str, max_results: int = 20) -> List[EbayListi
         return []
 
 
-def compare_product_on_ebay(
-    idealo_product: IdealoProduct, 
-    max_results: int = 10
-) -> List[EbayListing]:
+def compare_products_on_ebay(idealo_products: List[IdealoProduct]) -> dict:
     """
-    Search eBay for an Idealo product.
+    Search eBay for several Idealo products concurrently.
     
     Args:
-        idealo_product: The Idealo product to search for
-        max_results: Maximum number of eBay listings to fetch
+        idealo_products: Idealo products to search for
         
     Returns:
-        List of eBay listings found
+        Dictionary mapping product name to the eBay listings found
     """
-    # search eBay for the product
-    listings = run_ebay_scraper(idealo_product.name, max_results)
+    names = [p.name for p in idealo_products]
     
-    # log results for debugging (profit calculation moved to save_to_database)
-    if listings:
-        logger.info("ebay_search_completed", 
-            product=idealo_product.name,
-            listings_count=len(listings)
-        )
-        print(f"  → Found {len(listings)} eBay listings")
-    else:
-        logger.info("no_ebay_listings_found", product=idealo_product.name)
-        print(f"  → No eBay listings found")
+    try:
+        with EbayScraper() as scraper:
+            listings_by_name = scraper.search_many(names)
+    except Exception as e:
+        logger.error("ebay_scraping_failed", error=str(e), exc_info=True)
+        print(f"ERROR: eBay scraping failed: {e}")
+        listings_by_name = {}
     
-    return listings
+    logger.info(
+        "ebay_batch_search_completed",
+        products=len(names),
+        with_listings=sum(1 for name in names if listings_by_name.get(name))
+    )
+    return listings_by_name
 
 
 def run_full_production_flow() -> None:
@@ -202,86 +200,103 @@ def save_to_database(products: List[IdealoProduct], listings: List[EbayListing])
                     from src.integrations.telegram.telegram_notifier import TelegramNotifier
                     telegram_notifier = TelegramNotifier()
                     
-                    for idx, product_info in enumerate(needs_ebay_check, 1):
-                        print(f"[{idx}/{len(needs_ebay_check)}] Checking eBay for: {product_info['name'][:50]}... ({product_info['type']})")
-                        
-                        # use original IdealoProduct if available
-                        idealo_product = products_by_name.get(product_info['name'])
-                        
-                        if not idealo_product:
-                            # fallback: create from product_info (shouldn't happen normally)
-                            logger.warning("product_not_found_in_original_list", name=product_info['name'])
-                            idealo_product = IdealoProduct(
-                                name=product_info['name'],
-                                price=Decimal(str(product_info.get('price', 0))),
-                                discount=Decimal(str(product_info.get('discount', 0))) if product_info.get('discount') else None,
-                                source_url=product_info.get('source_url', 'https://idealo.de'),
-                                category=product_info.get('category', 'Unknown'),
-                                is_active=product_info.get('is_active', True)
-                            )
+                    try:
+                        # resolve the IdealoProduct for every product to check
+                        products_to_check = []
+                        for product_info in needs_ebay_check:
+                            # use original IdealoProduct if available
+                            idealo_product = products_by_name.get(product_info['name'])
+                            
+                            if not idealo_product:
+                                # fallback: create from product_info (shouldn't happen normally)
+                                logger.warning("product_not_found_in_original_list", name=product_info['name'])
+                                idealo_product = IdealoProduct(
+                                    name=product_info['name'],
+                                    price=Decimal(str(product_info.get('price', 0))),
+                                    discount=Decimal(str(product_info.get('discount', 0))) if product_info.get('discount') else None,
+                                    source_url=product_info.get('source_url', 'https://idealo.de'),
+                                    category=product_info.get('category', 'Unknown'),
+                                    is_active=product_info.get('is_active', True)
+                                )
+                            products_to_check.append((product_info, idealo_product))
                         
-                        # get eBay listings (no telegram here)
-                        ebay_listings = compare_product_on_ebay(
-                            idealo_product=idealo_product,
-                            max_results=10
+                        # fetch all eBay searches up front, concurrently (no telegram here)
+                        listings_by_name = compare_products_on_ebay(
+                            [idealo_product for _, idealo_product in products_to_check]
                         )
                         
-                        if ebay_listings:
-                            # calculate profitability using ProductComparison
-                            comparison = ProductComparison(
-                                idealo_product=idealo_product,
-                                ebay_listings=ebay_listings
-                            )
-                            comparison.calculate_profitability()
-                            
-                            logger.info("profitability_calculated", 
-                                product=idealo_product.name,
-                                is_profitable=comparison.is_profitable,
-                                potential_profit=comparison.potential_profit,
-                                min_ebay_price=comparison.min_ebay_price
+                        # products without listings only need their check timestamp, set in one go below
+                        unlisted_product_ids = []
+                        
+                        for idx, (product_info, idealo_product) in enumerate(products_to_check, 1):
+                            logger.debug(
+                                "checking_ebay_product",
+                                index=idx,
+                                total=len(needs_ebay_check),
+                                name=product_info['name'][:50],
+                                check_type=product_info['type']
                             )
                             
-                            # convert EbayListing objects to dictionaries
-                            listings_data = [
-                                {
-                                    "title": l.title,
-                                    "subtitle": l.subtitle if hasattr(l, 'subtitle') else None,
-                                    "price": l.price,
-                                    "source_url": str(l.source_url),
-                                    "image_url": str(l.image_url) if l.image_url else None,
-                                }
-                                for l in ebay_listings
-                            ]
+                            ebay_listings = listings_by_name.get(idealo_product.name, [])
                             
-                            # save eBay listings to database
-                            ebay_repo.update_listings_for_product(
-                                product_info['product_id'],
-                                listings_data
-                            )
-                            
-                            # save profit information to database
-                            idealo_repo.update_product_profit(
-                                product_id=product_info['product_id'],
-                                potential_profit=comparison.potential_profit,
-                                profit_percentage=comparison.profit_percentage,
-                                is_profitable=comparison.is_profitable,
-                                min_ebay_price=comparison.min_ebay_price
-                            )
-                            
-                            # send telegram notification ONLY if profitable and AFTER saving
-                            if comparison.is_profitable:
-                                telegram_notifier.send_profitable_deal_notification(
+                            if ebay_listings:
+                                # calculate profitability using ProductComparison
+                                comparison = ProductComparison.from_validated(
                                     idealo_product=idealo_product,
-                                    ebay_listings=ebay_listings,
-                                    comparison=comparison
+                                    ebay_listings=ebay_listings
+                                )
+                                comparison.calculate_profitability()
+                                
+                                logger.info("profitability_calculated", 
+                                    product=idealo_product.name,
+                                    is_profitable=comparison.is_profitable,
+                                    potential_profit=comparison.potential_profit,
+                                    min_ebay_price=comparison.min_ebay_price
+                                )
+                                
+                                # convert EbayListing objects to dictionaries
+                                listings_data = [
+                                    {
+                                        "title": l.title,
+                                        "subtitle": l.subtitle if hasattr(l, 'subtitle') else None,
+                                        "price": l.price,
+                                        "source_url": str(l.source_url),
+                                        "image_url": str(l.image_url) if l.image_url else None,
+                                    }
+                                    for l in ebay_listings
+                                ]
+                                
+                                # save eBay listings to database
+                                ebay_repo.update_listings_for_product(
+                                    product_info['product_id'],
+                                    listings_data
                                 )
-                                print(f"  → PROFITABLE! Potential profit: €{comparison.potential_profit}")
+                                
+                                # save profit information to database
+                                idealo_repo.update_product_profit(
+                                    product_id=product_info['product_id'],
+                                    potential_profit=comparison.potential_profit,
+                                    profit_percentage=comparison.profit_percentage,
+                                    is_profitable=comparison.is_profitable,
+                                    min_ebay_price=comparison.min_ebay_price
+                                )
+                                
+                                # send telegram notification ONLY if profitable and AFTER saving
+                                if TelegramNotifier.should_notify(comparison, telegram_notifier.telegram_config):
+                                    telegram_notifier.queue_profitable_deal_notification(
+                                        idealo_product=idealo_product,
+                                        ebay_listings=ebay_listings,
+                                        comparison=comparison
+                                    )
                             else:
-                                print(f"  → Not profitable (profit: €{comparison.potential_profit})")
-                        else:
-                            # still update timestamp even if no listings found
-                            idealo_repo.update_last_ebay_check(product_info['product_id'])
-                            print(f"  → No eBay listings found")
+                                # still update timestamp even if no listings found
+                                unlisted_product_ids.append(product_info['product_id'])
+                                logger.debug("no_ebay_listings_found", product=idealo_product.name)
+                        
+                        idealo_repo.update_last_ebay_check_bulk(unlisted_product_ids)
+                    finally:
+                        # send the buffered deals and release the session, even if a check failed
+                        telegram_notifier.close()
                     
                     print(f"SUCCESS: Completed eBay checks for {len(needs_ebay_check)} products")
             
@@ -399,6 +414,9 @@ Examples:
         logger.error("scraping_failed", error=str(e), exc_info=True)
         print(f"ERROR: Scraping failed: {e}")
         sys.exit(1)
+    finally:
+        # pooled connections live for the whole run
+        close_pool()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ from unittest.mock import Mock
 
 from src.core.models.ebay_listing import EbayListing
 from src.scrapers.ebay.ebay_parser import EbayParser
+from src.shared.utils.html_parsing import make_soup
 
 
 class TestEbayParser:
@@ -68,6 +69,16 @@ class TestEbayParser:
         assert parser.parse_price_text("99,00 EUR") == Decimal("99.00")
         assert parser.parse_price_text("invalid") is None
     
+    def test_parse_price_cents(self, parser):
+        """Test price texts are parsed to integer cents."""
+        assert parser.parse_price_cents("EUR 29,99") == 2999
+        assert parser.parse_price_cents("$19.99") == 1999
+        assert parser.parse_price_cents("€ 1.234,56") == 123456
+        assert parser.parse_price_cents("EUR 10,00 bis EUR 20,00") == 1000
+        assert parser.parse_price_cents("EUR 12,99 to EUR 15,00") == 1299
+        assert parser.parse_price_cents("Preis auf Anfrage") == 0
+        assert parser.parse_price_cents("EUR 1.234.567") == 0
+    
     def test_find_divider_index(self, parser):
         """Test finding divider index in search results."""
         # mock elements list with divider
@@ -83,4 +94,52 @@ class TestEbayParser:
         mock_elements.insert(3, divider)
         
         divider_index = parser.find_divider_index(mock_elements)
-        assert divider_index == 3
\ No newline at end of file
+        assert divider_index == 3
+    
+    def test_find_listings_on_page_keeps_only_items(self, parser):
+        """Test only product items inside the results list are returned, in page order."""
+        soup = make_soup(
+            "<ul class='srp-results'>"
+            "<li class='s-item'>1</li>"
+            "<li class='srp-river-answer--REWRITE_START'>divider</li>"
+            "<li class='s-card'>2</li>"
+            "<li>ad</li>"
+            "</ul>"
+            "<ul><li class='s-item'>outside</li></ul>"
+        )
+        
+        listings = parser.find_listings_on_page(soup)
+        
+        assert [item.get_text() for item in listings] == ["1", "2"]
+    
+    def test_scan_page_finds_items_and_divider(self, parser):
+        """Test one scan returns product items and the number of items before the divider."""
+        soup = make_soup(
+            "<ul class='srp-results'>"
+            "<li class='s-card'>1</li>"
+            "<li class='s-card'>2</li>"
+            "<li class='srp-river-answer--REWRITE_START'>Ergebnisse für weniger Suchbegriffe</li>"
+            "<li class='s-item'>3</li>"
+            "<li>ad</li>"
+            "</ul>"
+        )
+        
+        items, divider_index = parser.scan_page(soup)
+        
+        assert [item.get_text() for item in items] == ["1", "2", "3"]
+        assert divider_index == 2
+    
+    def test_scan_page_stops_at_limit_after_divider(self, parser):
+        """Test a limited scan stops once the divider is known and enough items are collected."""
+        soup = make_soup(
+            "<ul class='srp-results'>"
+            "<li class='s-card'>1</li>"
+            "<li class='srp-river-answer--REWRITE_START'>Ergebnisse für weniger Suchbegriffe</li>"
+            + "".join(f"<li class='s-card'>{i}</li>" for i in range(2, 50))
+            + "</ul>"
+        )
+        
+        items, divider_index = parser.scan_page(soup, limit=3)
+        
+        assert [item.get_text() for item in items] == ["1", "2", "3"]
+        assert divider_index == 1
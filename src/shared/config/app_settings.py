@@ -22,6 +22,7 @@ class DatabaseConfig(BaseSettings):
         POSTGRES_PASSWORD: Database password
         POSTGRES_HOST: Database host
         DB_PORT: Database port
+        DB_POOL_SIZE: Maximum number of pooled connections
     """
     
     model_config = SettingsConfigDict(
@@ -36,6 +37,7 @@ class DatabaseConfig(BaseSettings):
     POSTGRES_PASSWORD: str = Field(default="", description="PostgreSQL password")
     POSTGRES_HOST: str = Field(default="localhost", description="PostgreSQL host")
     DB_PORT: int = Field(default=5432, description="PostgreSQL port")
+    DB_POOL_SIZE: int = Field(default=10, ge=1, le=100, description="Maximum pooled PostgreSQL connections")
 
 
 class AppConfig(BaseSettings):
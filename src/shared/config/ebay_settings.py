@@ -17,6 +17,7 @@ class EbayScraperConfig(BaseSettings):
         MAX_BESTMATCH_ITEMS: Maximum number of best match items to collect
         MAX_LEASTMATCH_ITEMS: Maximum number of less relevant items to collect
         EBAY_MIN_PRICE: Minimum price filter for eBay searches
+        EBAY_MAX_CONCURRENCY: Maximum number of search pages fetched in parallel
     """
     
     model_config = SettingsConfigDict(
@@ -31,6 +32,7 @@ class EbayScraperConfig(BaseSettings):
     MAX_BESTMATCH_ITEMS: int = Field(default=10, ge=1, le=50)
     MAX_LEASTMATCH_ITEMS: int = Field(default=10, ge=1, le=20)
     EBAY_MIN_PRICE: int = Field(default=50, ge=0)
+    EBAY_MAX_CONCURRENCY: int = Field(default=8, ge=1, le=32)
 
 
 @lru_cache()
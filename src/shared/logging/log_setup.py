@@ -137,6 +137,8 @@ def setup_logging(
     # configure structlog
     structlog.configure(
         processors=console_processors,
+        # below-level calls become no-ops before any event dict is built
+        wrapper_class=structlog.make_filtering_bound_logger(current_log_level),
         logger_factory=structlog.WriteLoggerFactory(file=sys.stderr),
         cache_logger_on_first_use=True,
     )
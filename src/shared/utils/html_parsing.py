@@ -0,0 +1,46 @@
+"""
+Shared HTML parsing helpers for the scrapers.
+"""
+
+from functools import partial
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import LXMLTreeBuilder
+from lxml import etree
+
+
+class LeanLXMLTreeBuilder(LXMLTreeBuilder):
+    """
+    C-backed lxml tree builder that drops HTML comments and skips id collection.
+    
+    Shop pages are full of comment markers (eBay wraps most text nodes in
+    them); the scrapers never read comments, so libxml2 discards them before
+    they become Python objects.
+    """
+    
+    def default_parser(self, encoding):
+        """
+        Get the lxml parser factory used for each document.
+        
+        Args:
+            encoding: Document encoding, if known
+            
+        Returns:
+            HTMLParser factory configured to drop comments and skip id collection
+        """
+        return partial(etree.HTMLParser, remove_comments=True, collect_ids=False)
+
+
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse page HTML into a BeautifulSoup tree using the lxml builder.
+    
+    Args:
+        html: Raw page HTML
+        parse_only: Optional strainer; only matching tags and their contents are built
+        
+    Returns:
+        Parsed BeautifulSoup document
+    """
+    return BeautifulSoup(html, builder=LeanLXMLTreeBuilder, parse_only=parse_only)
@@ -0,0 +1,54 @@
+"""
+Integer-cent helpers for price parsing and arithmetic.
+
+Prices are handled as integer cents in the parsing and comparison hot
+paths and only turned into Decimal at the model/database boundary.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+
+def cents_from_parts(whole: str, fraction: str = "") -> int:
+    """
+    Build integer cents from the digit strings on both sides of the decimal separator.
+    
+    Args:
+        whole: Digits before the decimal separator (no thousands separators)
+        fraction: Digits after the decimal separator, if any
+        
+    Returns:
+        Price in cents
+        
+    Raises:
+        ValueError: If either part is not a digit string or the fraction has
+            more than two digits
+    """
+    if len(fraction) > 2:
+        raise ValueError(f"too many fraction digits: {fraction!r}")
+    return int(whole) * 100 + int((fraction + "00")[:2])
+
+
+def to_cents(amount: Decimal) -> int:
+    """
+    Convert a Decimal amount to integer cents.
+    
+    Args:
+        amount: Amount in EUR
+        
+    Returns:
+        Amount in cents, rounded half up
+    """
+    return int(amount.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """
+    Convert integer cents to an exact two-place Decimal.
+    
+    Args:
+        cents: Amount in cents
+        
+    Returns:
+        Amount in EUR
+    """
+    return Decimal(cents).scaleb(-2)
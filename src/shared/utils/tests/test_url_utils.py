@@ -0,0 +1,38 @@
+"""
+Unit tests for URL normalization.
+"""
+
+import pytest
+from pydantic import HttpUrl, TypeAdapter
+
+from src.shared.utils.url_utils import normalize_url
+
+
+class TestNormalizeUrl:
+    """Test normalize_url against pydantic's HttpUrl."""
+    
+    @pytest.mark.parametrize("url", [
+        "https://www.idealo.de/preisvergleich/OffersOfProduct/2032-apple.html",
+        "https://www.ebay.de/itm/123?_nkw=a&x=1",
+        "https://i.ebayimg.com/images/g/abc/s-l500.jpg",
+        "http://127.1/",
+        "http://10.0.0.1/x",
+        "https://idealo.de/a/%2e/b",
+        "https://idealo.de/a/%2E%2E/b",
+        "https://idealo.de/a/./b",
+        "https://IDEALO.de/a b",
+        "https://idealo.de/müller",
+    ])
+    def test_matches_http_url(self, url):
+        """Test fast path and fallback both return HttpUrl's normalized form."""
+        assert normalize_url(url) == str(TypeAdapter(HttpUrl).validate_python(url))
+    
+    @pytest.mark.parametrize("url", ["ftp://idealo.de/", "idealo.de/x", "http://999.1.1.1/", "http://foo.123/"])
+    def test_invalid_url_raises(self, url):
+        """Test invalid URLs raise ValueError."""
+        with pytest.raises(ValueError):
+            normalize_url(url)
+    
+    def test_none_passes_through(self):
+        """Test None is returned unchanged."""
+        assert normalize_url(None) is None
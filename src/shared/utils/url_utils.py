@@ -0,0 +1,53 @@
+"""
+URL validation helpers for scraped models.
+
+Scraped URLs are stored in the form pydantic's HttpUrl produced, because
+source_url is the upsert key for products and listings.
+"""
+
+import re
+from typing import Optional
+
+from pydantic import HttpUrl, TypeAdapter, ValidationError
+
+_URL_RE = re.compile(r'^https?://')
+
+# lowercase domain whose last label starts with a letter (IPv4 forms like 127.1 are
+# rewritten by HttpUrl), no port, no dot segments (plain or %2e-encoded), only
+# characters HttpUrl leaves untouched
+_PLAIN_URL_RE = re.compile(
+    r'^https?://(?:[a-z0-9\-]+\.)*[a-z][a-z0-9\-]*/'
+    r'(?!.*%2[eE])(?!.*/\.{1,2}(?:[/?#]|$))[^\x00-\x20\x7f-\U0010ffff"\'<>`{}\\]*$'
+)
+
+_http_url_adapter = TypeAdapter(HttpUrl)
+
+
+def normalize_url(url: Optional[str]) -> Optional[str]:
+    """
+    Validate an absolute http(s) URL and return it in HttpUrl's normalized form.
+    
+    Plain ASCII URLs are already normalized and only get a scheme check; the
+    rest (non-ASCII characters, spaces, uppercase or numeric hosts, %2e
+    segments, ...) go through the full HttpUrl parser so they are normalized
+    exactly as before.
+    
+    Args:
+        url: URL to validate, or None
+    
+    Returns:
+        Normalized URL, or None if no URL was given
+    
+    Raises:
+        ValueError: If the URL is not a valid http(s) URL
+    """
+    if url is None:
+        return None
+    if not _URL_RE.match(url):
+        raise ValueError("Input should be a valid URL")
+    if _PLAIN_URL_RE.match(url):
+        return url
+    try:
+        return str(_http_url_adapter.validate_python(url))
+    except ValidationError:
+        raise ValueError("Input should be a valid URL")
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('deal_board', '0006_ebaylisting_is_best_match_product_is_profitable_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['source_url'], name='product_active_source_url_idx'),
+        ),
+    ]
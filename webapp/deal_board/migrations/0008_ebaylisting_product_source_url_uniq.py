@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('deal_board', '0007_product_active_source_url_idx'),
+    ]
+
+    operations = [
+        # keep the newest row of any (product, url) duplicates so the constraint can be added
+        migrations.RunSQL(
+            sql="""
+                DELETE FROM deal_board_ebaylisting a
+                USING deal_board_ebaylisting b
+                WHERE a.product_id = b.product_id
+                  AND a.source_url = b.source_url
+                  AND a.id < b.id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='ebaylisting',
+            constraint=models.UniqueConstraint(fields=('product', 'source_url'), name='ebaylisting_product_source_url_uniq'),
+        ),
+    ]
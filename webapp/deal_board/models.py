@@ -22,6 +22,16 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # lets the scraper's "deactivate missing products" update skip inactive rows
+            models.Index(
+                fields=["source_url"],
+                name="product_active_source_url_idx",
+                condition=models.Q(is_active=True),
+            ),
+        ]
+
     def __str__(self):
         return self.name
     
@@ -55,5 +65,14 @@ class EbayListing(models.Model):
     is_best_match = models.BooleanField(default=False, help_text="Whether listing was in eBay's best match section.")
     scraped_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            # listing url is the identity the scraper merges on
+            models.UniqueConstraint(
+                fields=["product", "source_url"],
+                name="ebaylisting_product_source_url_uniq",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.title} for €{self.price}"
\ No newline at end of file